@@ -1,7 +1,17 @@
+import gc
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
 import unittest
-from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, TypedDict, TypeGuard, Union
 
-from typeca import type_enforcer
+from typeca import ArgumentTypeError, ValidationError, type_enforcer, validate
+from typeca.decorator import (ForwardRefChecker, LazySignature, ListChecker,
+                              StandardTypeChecker, UnionChecker)
 
 
 class TestEnforceTypes(unittest.TestCase):
@@ -484,3 +494,610 @@ class TestEnforceTypes(unittest.TestCase):
             return a * b
 
         self.assertEqual(add(['a'], 2), ['a', 'a'])
+
+    def test_pipe_union_rejects_other_types(self):
+        @type_enforcer()
+        def process_union(value: int | str) -> int | str:
+            return value
+
+        with self.assertRaises(TypeError):
+            process_union(10.5)
+
+    def test_variadic_tuple(self):
+        @type_enforcer()
+        def total(values: tuple[int, ...]) -> int:
+            return sum(values)
+
+        self.assertEqual(total(()), 0)
+        self.assertEqual(total((1, 2, 3)), 6)
+
+        with self.assertRaises(TypeError):
+            total((1, '2'))
+
+    def test_bare_typing_containers(self):
+        @type_enforcer()
+        def pack(a: List, b: Dict, c: Tuple, d: Set, e: FrozenSet) -> Tuple:
+            return a, b, c, d, e
+
+        self.assertEqual(pack([1, 'a'], {1: 'a'}, (1, 'a'), {1}, frozenset()),
+                         ([1, 'a'], {1: 'a'}, (1, 'a'), {1}, frozenset()))
+        with self.assertRaises(TypeError):
+            pack((1,), {}, (), set(), frozenset())
+        with self.assertRaises(TypeError):
+            pack([], {}, [], set(), frozenset())
+
+    def test_keyword_only_and_positional_only_args(self):
+        @type_enforcer()
+        def process(a: int, /, b: str, *, c: float = 1.0) -> str:
+            return f'{a}{b}{c}'
+
+        self.assertEqual(process(1, 'x'), '1x1.0')
+        self.assertEqual(process(1, b='x', c=2.0), '1x2.0')
+
+        with self.assertRaises(TypeError) as context:
+            process(1, 'x', c='2')
+        self.assertIn("Argument 'c' must be of type <class 'float'>", str(context.exception))
+
+        with self.assertRaises(TypeError) as context:
+            process('1', b='x')
+        self.assertIn("Argument 'a' must be of type <class 'int'>", str(context.exception))
+
+    def test_annotated_var_args(self):
+        @type_enforcer()
+        def process(*args: tuple[int, int], **kwargs: dict[str, str]) -> int:
+            return len(args) + len(kwargs)
+
+        self.assertEqual(process(1, 2, a='x'), 3)
+
+        with self.assertRaises(TypeError) as context:
+            process(1, 2, a=1)
+        self.assertIn("Argument 'kwargs' must be", str(context.exception))
+
+    def test_default_values_are_checked(self):
+        @type_enforcer()
+        def process(a: int, b: int = 'default') -> int:
+            return a
+
+        with self.assertRaises(TypeError) as context:
+            process(1)
+        self.assertIn("Argument 'b' must be of type", str(context.exception))
+
+    def test_missing_argument_raises_type_error(self):
+        @type_enforcer()
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        with self.assertRaises(TypeError):
+            add(1)
+
+
+class LabeledPoint(TypedDict, total=False):
+    label: str
+
+
+class Point(LabeledPoint):
+    x: int
+    y: int
+
+
+@dataclass
+class User:
+    name: str
+    age: int
+    tags: tuple[str, ...] = ()
+
+
+class TestCoerce(unittest.TestCase):
+
+    def test_scalar_coercion(self):
+        @type_enforcer(coerce=True)
+        def scale(value: int, factor: float, enabled: bool) -> float:
+            return value * factor if enabled else 0.0
+
+        self.assertEqual(scale('3', 2, 'true'), 6.0)
+        self.assertEqual(scale(3.0, '0.5', 1), 1.5)
+
+    def test_incoercible_value_raises(self):
+        @type_enforcer(coerce=True)
+        def double(value: int) -> int:
+            return value * 2
+
+        with self.assertRaises(TypeError) as context:
+            double('three')
+        self.assertIn("Argument 'value' must be of type <class 'int'>", str(context.exception))
+
+        with self.assertRaises(TypeError):
+            double(2.5)
+
+    def test_matching_values_are_not_copied(self):
+        @type_enforcer(coerce=True)
+        def identity(values: list[int], mapping: dict[str, int]) -> list[int]:
+            self.assertIs(mapping, data)
+            return values
+
+        items = [1, 2, 3]
+        data = {'a': 1}
+        self.assertIs(identity(items, data), items)
+
+    def test_container_coercion(self):
+        @type_enforcer(coerce=True)
+        def process(pair: tuple[int, str], values: list[int], unique: set[int]) \
+                -> dict[str, list[int]]:
+            return {'pair': [pair[0]], 'values': values, 'unique': sorted(unique)}
+
+        self.assertEqual(process([1, 'a'], ('2', 3), ['4', 4]),
+                         {'pair': [1], 'values': [2, 3], 'unique': [4]})
+
+    def test_union_coercion(self):
+        @type_enforcer(coerce=True)
+        def process(value: int | None) -> int | None:
+            return value
+
+        self.assertEqual(process('5'), 5)
+        self.assertIsNone(process(None))
+
+    def test_union_members_are_tried_in_order(self):
+        @type_enforcer(coerce=True)
+        def as_int(value: int | float) -> int | float:
+            return value
+
+        @type_enforcer(coerce=True)
+        def as_float(value: list[float | int]) -> list[float | int]:
+            return value
+
+        self.assertEqual(as_int('3'), 3)
+        self.assertIs(type(as_int('3')), int)
+        self.assertIs(type(as_float(['3'])[0]), float)
+
+    def test_typed_dict_coercion(self):
+        @type_enforcer(coerce=True)
+        def move(point: Point) -> Point:
+            return {'x': point['x'] + 1, 'y': point['y'], 'label': point.get('label', '')}
+
+        self.assertEqual(move({'x': '1', 'y': 2}), {'x': 2, 'y': 2, 'label': ''})
+
+        with self.assertRaises(TypeError):
+            move({'x': 1})
+
+    def test_typed_dict_without_coercion(self):
+        @type_enforcer()
+        def move(point: Point) -> int:
+            return point['x']
+
+        self.assertEqual(move({'x': 1, 'y': 2}), 1)
+
+        with self.assertRaises(TypeError):
+            move({'x': '1', 'y': 2})
+
+    def test_dataclass_coercion(self):
+        @type_enforcer(coerce=True)
+        def load(user: User) -> User:
+            return user
+
+        self.assertEqual(load({'name': 'Ann', 'age': '30', 'tags': ['a']}),
+                         User('Ann', 30, ('a',)))
+
+        with self.assertRaises(TypeError):
+            load({'name': 'Ann'})
+
+    def test_keyword_and_var_args_coercion(self):
+        @type_enforcer(coerce=True)
+        def process(a: int, *args: tuple[int, ...], b: float = 1, **kwargs: dict[str, int]):
+            return a, args, b, kwargs
+
+        self.assertEqual(process('1', 2, '3', b='4', c='5'), (1, (2, 3), 4.0, {'c': 5}))
+        self.assertEqual(process(a='1'), (1, (), 1.0, {}))
+
+    def test_return_coercion(self):
+        @type_enforcer(coerce=True)
+        def parse() -> tuple[int, ...] | list[int]:
+            return ('1', '2')
+
+        self.assertEqual(parse(), (1, 2))
+
+        @type_enforcer(coerce=True)
+        def broken() -> int:
+            return 'x'
+
+        with self.assertRaises(TypeError) as context:
+            broken()
+        self.assertIn("Return value must be of type <class 'int'>", str(context.exception))
+
+
+JSON = dict[str, 'JSON'] | list['JSON'] | str | int | None
+Settings = dict[str, 'Settings'] | list['Settings'] | str | None
+
+
+@dataclass
+class Node:
+    value: int
+    next: 'Node | None' = None
+
+
+class Tree(TypedDict):
+    value: int
+    children: list['Tree']
+
+
+class TestRecursiveTypes(unittest.TestCase):
+
+    def test_recursive_alias(self):
+        @type_enforcer()
+        def echo(data: JSON) -> JSON:
+            return data
+
+        message = {'a': [1, 'b', None, {'c': []}]}
+        self.assertIs(echo(message), message)
+
+        with self.assertRaises(TypeError) as context:
+            echo({'a': [1, {'b': 1.5}]})
+        self.assertIn("Argument 'data' must be of type", str(context.exception))
+
+    def test_deeply_nested_payload(self):
+        @type_enforcer()
+        def echo(data: JSON) -> JSON:
+            return data
+
+        depth = sys.getrecursionlimit() * 10
+        valid = invalid = None
+        for _ in range(depth):
+            valid = {'key': [valid]}
+            invalid = [invalid if invalid is not None else 1.5]
+
+        self.assertIs(echo(valid), valid)
+        with self.assertRaises(TypeError):
+            echo(invalid)
+
+    def test_deeply_nested_payload_coercion(self):
+        @type_enforcer(coerce=True)
+        def echo(data: JSON) -> JSON:
+            return data
+
+        depth = sys.getrecursionlimit() * 10
+        convertible = invalid = None
+        for _ in range(depth):
+            convertible = [convertible if convertible is not None else 1.0]
+            invalid = [invalid if invalid is not None else 1.5]
+
+        result = echo(convertible)
+        for _ in range(depth):
+            result = result[0]
+        self.assertIs(type(result), int)
+
+        with self.assertRaises(ArgumentTypeError):
+            echo(invalid)
+        with self.assertRaises(ValidationError):
+            validate(invalid, JSON, coerce=True, globalns=globals())
+
+    def test_cyclic_data_coercion(self):
+        @type_enforcer(coerce=True)
+        def echo(data: JSON) -> JSON:
+            return data
+
+        data = {'items': [1]}
+        data['self'] = data
+        self.assertIs(echo(data), data)
+
+        data['items'].append(1.0)
+        with self.assertRaises(ArgumentTypeError):
+            echo(data)
+
+        items = [1.0]
+        self.assertEqual(echo({'a': items, 'b': items}), {'a': [1], 'b': [1]})
+
+    def test_deeply_nested_records(self):
+        @type_enforcer()
+        def count(tree: Tree) -> int:
+            return 0
+
+        depth = sys.getrecursionlimit() * 10
+        tree = {'value': 0, 'children': []}
+        for _ in range(depth):
+            tree = {'value': 0, 'children': [tree]}
+        self.assertEqual(count(tree), 0)
+
+        with self.assertRaises(TypeError):
+            count({'value': 0, 'children': [tree, {'value': 'x', 'children': []}]})
+
+    def test_cyclic_records(self):
+        @type_enforcer()
+        def count(tree: Tree) -> int:
+            return 0
+
+        tree = {'value': 0, 'children': []}
+        tree['children'].append(tree)
+        self.assertEqual(count(tree), 0)
+
+        tree['children'].append({'value': 'x', 'children': []})
+        with self.assertRaises(TypeError):
+            count(tree)
+
+    def test_deeply_nested_record_coercion(self):
+        @type_enforcer(coerce=True)
+        def load(node: Node) -> int:
+            depth = 0
+            while node.next is not None:
+                node, depth = node.next, depth + 1
+            return node.value + depth
+
+        depth = sys.getrecursionlimit() * 10
+        data = {'value': '1'}
+        for _ in range(depth):
+            data = {'value': 0, 'next': data}
+        self.assertEqual(load(data), depth + 1)
+
+        with self.assertRaises(ArgumentTypeError):
+            load({'value': 0, 'next': {'value': 'x'}})
+
+    def test_cyclic_data(self):
+        @type_enforcer()
+        def echo(data: JSON) -> JSON:
+            return data
+
+        data = {'items': [1, 2]}
+        data['self'] = data
+        data['items'].append(data['items'])
+        self.assertIs(echo(data), data)
+
+        data['items'].append(1.5)
+        with self.assertRaises(TypeError):
+            echo(data)
+
+    def test_checker_graph_is_cyclic(self):
+        @type_enforcer()
+        def echo(data: JSON) -> JSON:
+            return data
+
+        echo([])
+        union_checker = get_lazy_signature(echo).compiled.params[0][-1]
+        dict_checker = union_checker.checkers[0]
+        self.assertIs(dict_checker.value_checker.get_target(), union_checker)
+
+    def test_string_annotations(self):
+        @type_enforcer()
+        def walk(node: 'Node') -> 'list[int]':
+            values = []
+            while node is not None:
+                values.append(node.value)
+                node = node.next
+            return values
+
+        self.assertEqual(walk(Node(1, Node(2))), [1, 2])
+        with self.assertRaises(TypeError):
+            walk({'value': 1})
+
+    def test_resolvable_string_annotations_are_compiled_directly(self):
+        @type_enforcer()
+        def add(a: 'int', b: 'list[int]', data: 'JSON') -> 'int':
+            return a
+
+        add(1, [2], None)
+        compiled = get_lazy_signature(add).compiled
+        a_checker, b_checker, data_checker = (param[-1] for param in compiled.params)
+        self.assertIsInstance(a_checker, StandardTypeChecker)
+        self.assertIsInstance(b_checker, ListChecker)
+        self.assertIsInstance(b_checker.elem_checker, StandardTypeChecker)
+        # Only the references closing the cycle of the recursive alias are kept.
+        self.assertIsInstance(data_checker, UnionChecker)
+        self.assertIsInstance(data_checker.checkers[1].elem_checker, ForwardRefChecker)
+
+    def test_self_referencing_dataclass_coercion(self):
+        @type_enforcer(coerce=True)
+        def load(node: Node) -> Node:
+            return node
+
+        self.assertEqual(load({'value': '1', 'next': {'value': 2}}), Node(1, Node(2)))
+
+    @unittest.skipUnless(sys.version_info >= (3, 12), 'type statement requires Python 3.12')
+    def test_type_statement_alias(self):
+        namespace = {}
+        exec('type Tree = dict[str, Tree] | list[Tree] | int', namespace)
+        tree_type = namespace['Tree']
+
+        @type_enforcer()
+        def echo(tree: tree_type) -> tree_type:
+            return tree
+
+        deep = 1
+        for _ in range(sys.getrecursionlimit() * 10):
+            deep = {'child': [deep]}
+
+        self.assertIs(echo(deep), deep)
+        with self.assertRaises(TypeError):
+            echo({'child': ['leaf']})
+
+        exec('type Ints = list[int]', namespace)
+        self.assertIsInstance(type_enforcer.factory.get_checker(namespace['Ints']), ListChecker)
+
+    def test_union_of_containers_and_scalars(self):
+        @type_enforcer()
+        def process(value: list[int] | dict[str, int] | int) -> int:
+            return 0
+
+        self.assertEqual(process(5), 0)
+        self.assertEqual(process([1]), 0)
+        self.assertEqual(process({'a': 1}), 0)
+        with self.assertRaises(TypeError):
+            process(['a'])
+
+
+def get_lazy_signature(wrapper):
+    lazy_signature = wrapper.lazy_signature
+    assert isinstance(lazy_signature, LazySignature)
+    return lazy_signature
+
+
+class TestPrewarm(unittest.TestCase):
+
+    def test_prewarm_compiles_decorated_functions(self):
+        @type_enforcer()
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        lazy_signature = get_lazy_signature(add)
+        self.assertIsNone(lazy_signature.compiled)
+
+        self.assertGreaterEqual(type_enforcer.prewarm(), 1)
+        self.assertIsNotNone(lazy_signature.compiled)
+        self.assertEqual(type_enforcer.prewarm(), 0)
+
+        self.assertEqual(add(3, 4), 7)
+        with self.assertRaises(TypeError):
+            add(3, '4')
+
+    def test_broken_annotation_does_not_stop_prewarm(self):
+        @type_enforcer()
+        def broken(value: TypeGuard[int]) -> bool:
+            return True
+
+        @type_enforcer()
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        self.assertGreaterEqual(type_enforcer.prewarm(), 1)
+        self.assertIsNone(get_lazy_signature(broken).compiled)
+        self.assertIsNotNone(get_lazy_signature(add).compiled)
+
+        with self.assertRaises(TypeError):
+            broken(1)
+
+    def test_concurrent_first_calls_compile_once(self):
+        @type_enforcer()
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        lazy_signature = get_lazy_signature(add)
+        signature_helper = add.signature_helper
+        compile_signature = signature_helper.compile_signature
+        calls = []
+
+        def slow_compile(hints, sig, globalns=None):
+            calls.append(hints)
+            time.sleep(0.05)
+            return compile_signature(hints, sig, globalns)
+
+        signature_helper.compile_signature = slow_compile
+        barrier = threading.Barrier(8)
+        results = []
+
+        def first_call():
+            barrier.wait()
+            results.append(lazy_signature.compile(signature_helper))
+
+        threads = [threading.Thread(target=first_call) for _ in range(8)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            del signature_helper.compile_signature
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(compiled is results[0] for compiled in results))
+        self.assertEqual(add(3, 4), 7)
+
+    def test_prewarm_compiles_record_fields(self):
+        @dataclass
+        class Item:
+            sku: str
+            quantity: int
+
+        class Order(TypedDict):
+            items: list[Item]
+
+        @type_enforcer()
+        def place(order: Order, extra: Item | None = None) -> int:
+            return len(order['items'])
+
+        type_enforcer.prewarm()
+        order_checker, extra_checker = (param[-1] for param in
+                                        get_lazy_signature(place).compiled.params)
+        self.assertIsNotNone(order_checker.field_checkers)
+        item_checker = order_checker.field_checkers['items'].elem_checker
+        self.assertIsNotNone(item_checker.field_checkers)
+        self.assertIs(extra_checker.checkers[0], item_checker)
+
+        self.assertEqual(place({'items': [Item('a', 1)]}), 1)
+
+    def test_prewarm_resolves_references(self):
+        @type_enforcer()
+        def load(settings: Settings) -> 'Undefined':  # noqa: F821
+            return settings
+
+        type_enforcer.prewarm()
+        compiled = get_lazy_signature(load).compiled
+        union_checker = compiled.params[0][-1]
+        dict_checker, list_checker = union_checker.checkers[:2]
+        self.assertIs(dict_checker.value_checker.target, union_checker)
+        self.assertIs(list_checker.elem_checker.target, union_checker)
+        # Names that don't resolve yet are left for the first call.
+        self.assertIsNone(compiled.return_checker.target)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_compile_lock_is_reset_in_forked_child(self):
+        @type_enforcer()
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        with LazySignature._compile_lock:
+            pid = os.fork()
+            if pid == 0:
+                # Dies from SIGALRM instead of hanging if the lock is still held.
+                signal.alarm(5)
+                os._exit(0 if add(1, 2) == 3 else 1)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+
+    def test_compiled_signature_is_compact(self):
+        @type_enforcer()
+        def scale(values: list[int], factor: int = 2) -> list[int]:
+            return [v * factor for v in values]
+
+        type_enforcer.prewarm()
+        lazy_signature = get_lazy_signature(scale)
+        compiled = lazy_signature.compiled
+
+        self.assertFalse(hasattr(compiled, '__dict__'))
+        self.assertIsInstance(compiled.params, tuple)
+        self.assertEqual([param[0] for param in compiled.params], ['values', 'factor'])
+        self.assertIsNone(lazy_signature.hints)
+
+
+class TestMemoryFootprint(unittest.TestCase):
+    FUNCTIONS = 1000
+    MAX_BYTES_PER_FUNCTION = 1536
+
+    def test_memory_per_decorated_function(self):
+        def make_function():
+            def process(a: int, values: list[int], mapping: dict[str, int | None]) -> int:
+                return a
+
+            process.__annotations__  # materialize the function's own annotations dict
+            return process
+
+        functions = [make_function() for _ in range(self.FUNCTIONS)]
+        gc.collect()
+
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            decorated = [type_enforcer()(func) for func in functions]
+            type_enforcer.prewarm()
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        per_function = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+        per_function /= self.FUNCTIONS
+        self.assertEqual(len(decorated), self.FUNCTIONS)
+        self.assertLess(per_function, self.MAX_BYTES_PER_FUNCTION)
+
+    def test_checkers_have_no_instance_dict(self):
+        checker = type_enforcer.factory.get_checker(dict[str, list[tuple[int, str] | None]])
+
+        self.assertFalse(hasattr(checker, '__dict__'))
+        self.assertFalse(hasattr(checker.value_checker, '__dict__'))
+        self.assertFalse(hasattr(checker.value_checker.elem_checker, '__dict__'))
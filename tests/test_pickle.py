@@ -0,0 +1,83 @@
+import multiprocessing
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from typeca import type_enforcer
+
+
+@type_enforcer()
+def square(x: int) -> int:
+    return x * x
+
+
+def _cube(x: int) -> int:
+    return x ** 3
+
+
+cube = type_enforcer()(_cube)
+parse = type_enforcer()(lambda x: x)
+
+
+def _to_int(x: int) -> int:
+    return x
+
+
+to_int = type_enforcer(coerce=True, on_violation='warn')(_to_int)
+
+
+class Shape:
+    @type_enforcer()
+    def area(self, side: int) -> int:
+        return side * side
+
+
+def check_in_child(func, value):
+    try:
+        return func(value)
+    except TypeError as err:
+        return type(err).__name__
+
+
+class TestPickle(unittest.TestCase):
+
+    def test_pickles_by_reference(self):
+        data = pickle.dumps(square)
+
+        self.assertIn(b'square', data)
+        self.assertNotIn(b'_square', data)
+        self.assertIs(pickle.loads(data), square)
+
+    def test_method_pickles_by_reference(self):
+        self.assertIs(pickle.loads(pickle.dumps(Shape.area)), Shape.area)
+        self.assertEqual(pickle.loads(pickle.dumps(Shape().area))(3), 9)
+
+    def test_aliased_function_is_rebuilt(self):
+        data = pickle.dumps(cube)
+        self.assertIn(b'_cube', data)
+
+        rebuilt = pickle.loads(data)
+        self.assertEqual(rebuilt(2), 8)
+        with self.assertRaises(TypeError):
+            rebuilt('2')
+
+        self.assertIs(pickle.loads(data), rebuilt)
+
+    def test_rebuilt_function_keeps_options(self):
+        rebuilt = pickle.loads(pickle.dumps(to_int))
+
+        self.assertEqual(rebuilt('2'), 2)
+        self.assertEqual(rebuilt('x'), 'x')
+        type_enforcer.violations.pending.clear()
+
+    def test_unreachable_function_is_not_picklable(self):
+        with self.assertRaises((pickle.PicklingError, AttributeError)):
+            pickle.dumps(parse)
+
+    def test_process_pool(self):
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            self.assertEqual(list(executor.map(square, [1, 2, 3])), [1, 4, 9])
+            self.assertEqual(list(executor.map(cube, [1, 2])), [1, 8])
+            self.assertEqual(executor.submit(check_in_child, cube, '2').result(),
+                             'ArgumentTypeError')
@@ -0,0 +1,120 @@
+import unittest
+from collections.abc import Sequence
+from typing import Annotated, Any, Final, Literal, Optional, TypedDict, TypeGuard, Union
+
+from typeca import ValidationError, is_instance, type_enforcer, validate
+
+
+JSON = dict[str, 'JSON'] | list['JSON'] | str | int | None
+
+
+class Message(TypedDict):
+    id: int
+    payload: dict[str, Any]
+
+
+class TestIsInstance(unittest.TestCase):
+
+    def test_simple_types(self):
+        self.assertTrue(is_instance(1, int))
+        self.assertFalse(is_instance('1', int))
+        self.assertTrue(is_instance(None, None))
+        self.assertTrue(is_instance(object(), Any))
+
+    def test_nested_json_annotation(self):
+        annotation = dict[str, list[int | None]]
+
+        self.assertTrue(is_instance({'a': [1, None], 'b': []}, annotation))
+        self.assertFalse(is_instance({'a': [1, 'x']}, annotation))
+        self.assertFalse(is_instance({1: [1]}, annotation))
+
+    def test_optional_and_tuples(self):
+        self.assertTrue(is_instance(None, Optional[tuple[int, str]]))
+        self.assertTrue(is_instance((1, 'a'), Optional[tuple[int, str]]))
+        self.assertFalse(is_instance((1, 2), Optional[tuple[int, str]]))
+
+    def test_typed_dict_with_any(self):
+        self.assertTrue(is_instance({'id': 1, 'payload': {'k': object()}}, Message))
+        self.assertFalse(is_instance({'id': '1', 'payload': {}}, Message))
+        self.assertFalse(is_instance({'payload': {}}, Message))
+
+    def test_checker_is_compiled_once(self):
+        annotation = dict[str, list[int | None]]
+        is_instance({}, annotation)
+        checker = type_enforcer.factory.get_checker(annotation)
+
+        is_instance({'a': [1]}, annotation)
+        self.assertIs(type_enforcer.factory.get_checker(annotation), checker)
+
+    def test_recursive_alias(self):
+        self.assertTrue(is_instance({'a': [1, {'b': None}]}, JSON, globals()))
+        self.assertFalse(is_instance({'a': [1, {'b': 1.5}]}, JSON, globals()))
+
+    def test_forward_reference_without_namespace(self):
+        with self.assertRaises(NameError):
+            is_instance({'a': [1]}, JSON)
+
+    def test_literal(self):
+        self.assertTrue(is_instance('a', Literal['a', 'b']))
+        self.assertFalse(is_instance('c', Literal['a', 'b']))
+        self.assertFalse(is_instance(5, Literal['a']))
+        self.assertFalse(is_instance(True, Literal[1]))
+        self.assertFalse(is_instance([], Literal[1]))
+        self.assertTrue(is_instance({'kind': 'ping'}, dict[str, Literal['ping', 'pong']]))
+
+    def test_generic_without_checker_checks_origin(self):
+        self.assertTrue(is_instance([1], Sequence[int]))
+        self.assertFalse(is_instance(5, Sequence[int]))
+
+    def test_type_of_class(self):
+        self.assertTrue(is_instance(bool, type[int]))
+        self.assertFalse(is_instance(str, type[int]))
+        self.assertFalse(is_instance(5, type[int]))
+        self.assertTrue(is_instance(str, type[Any]))
+
+    def test_qualifiers_check_wrapped_type(self):
+        self.assertTrue(is_instance(1, Annotated[int, 'positive']))
+        self.assertFalse(is_instance('1', Annotated[int, 'positive']))
+        self.assertFalse(is_instance('1', Final[int]))
+
+    def test_unsupported_generic_is_rejected(self):
+        with self.assertRaises(TypeError):
+            is_instance(True, TypeGuard[int])
+
+
+class TestValidate(unittest.TestCase):
+
+    def test_returns_value(self):
+        message = {'a': [1, None]}
+        self.assertIs(validate(message, dict[str, list[int | None]]), message)
+
+    def test_raises_validation_error(self):
+        with self.assertRaises(ValidationError) as context:
+            validate({'a': ['x']}, dict[str, list[int]])
+        self.assertIn('Value must be of type dict[str, list[int]], but got dict',
+                      str(context.exception))
+
+        with self.assertRaises(TypeError):
+            validate('1', int)
+
+    def test_rejects_unchecked_generics(self):
+        with self.assertRaises(ValidationError):
+            validate(5, Literal['a'])
+        with self.assertRaises(ValidationError):
+            validate(5, Sequence[int])
+        with self.assertRaises(ValidationError):
+            validate(5, type[int])
+
+    def test_coerce(self):
+        self.assertEqual(validate({'a': ['1', 2]}, dict[str, tuple[int, ...]], coerce=True),
+                         {'a': (1, 2)})
+
+        with self.assertRaises(ValidationError):
+            validate({'a': ['x']}, dict[str, list[int]], coerce=True)
+
+    def test_coerce_follows_union_order(self):
+        self.assertIs(type(validate('3', float | int, coerce=True)), float)
+        self.assertIs(type(validate('3', int | float, coerce=True)), int)
+        self.assertIs(validate(1, Union[bool, int], coerce=True), 1)
+        self.assertIs(validate('1', Union[bool, int], coerce=True), True)
+        self.assertIs(validate('1', Union[int, bool], coerce=True), 1)
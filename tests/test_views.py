@@ -0,0 +1,148 @@
+import unittest
+
+from typeca import CheckedMapping, CheckedSequence, ReturnTypeError, type_enforcer
+
+
+class TestLazyReturn(unittest.TestCase):
+
+    def test_list_items_checked_on_access(self):
+        @type_enforcer(lazy_return=True)
+        def top(n: int) -> list[int]:
+            return list(range(n)) + ['bad']
+
+        result = top(1000)
+        self.assertIsInstance(result, CheckedSequence)
+        self.assertEqual(len(result), 1001)
+        self.assertEqual(result[:3], [0, 1, 2])
+        self.assertEqual(result[999], 999)
+
+        with self.assertRaises(ReturnTypeError) as context:
+            result[-1]
+        self.assertIn("Return value must be of type list[int], but got str",
+                      str(context.exception))
+
+    def test_only_read_items_are_checked(self):
+        @type_enforcer(lazy_return=True)
+        def page() -> list[int]:
+            return [1, 2, 'bad']
+
+        result = page()
+        self.assertEqual(result[0], 1)
+        self.assertEqual(result[0], 1)
+        self.assertEqual(bytes(result.validated), b'\x01\x00\x00')
+
+    def test_sequence_api(self):
+        @type_enforcer(lazy_return=True)
+        def values() -> list[int]:
+            return [3, 1, 2]
+
+        result = values()
+        self.assertEqual(list(result), [3, 1, 2])
+        self.assertEqual(result, [3, 1, 2])
+        self.assertEqual(list(reversed(result)), [2, 1, 3])
+        self.assertIn(1, result)
+        self.assertEqual(result.index(2), 2)
+        self.assertEqual(sorted(result), [1, 2, 3])
+
+        with self.assertRaises(IndexError):
+            result[3]
+
+    def test_variadic_tuple(self):
+        @type_enforcer(lazy_return=True)
+        def values() -> tuple[str, ...]:
+            return ('a', 1)
+
+        result = values()
+        self.assertEqual(result[0], 'a')
+        with self.assertRaises(TypeError):
+            list(result)
+
+    def test_dict_entries_checked_on_access(self):
+        @type_enforcer(lazy_return=True)
+        def scores() -> dict[str, int]:
+            return {'a': 1, 'b': 'bad', 3: 3}
+
+        result = scores()
+        self.assertIsInstance(result, CheckedMapping)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result['a'], 1)
+        self.assertEqual(result.get('a'), 1)
+        self.assertEqual(result.validated, {'a'})
+
+        with self.assertRaises(ReturnTypeError):
+            result['b']
+        with self.assertRaises(ReturnTypeError):
+            result[3]
+        with self.assertRaises(ReturnTypeError):
+            list(result)
+
+    def test_membership_does_not_check_values(self):
+        @type_enforcer(lazy_return=True)
+        def scores() -> dict[str, int]:
+            return {'a': 1, 'b': 'bad'}
+
+        result = scores()
+        self.assertIn('b', result)
+        self.assertNotIn('c', result)
+        self.assertEqual(result.validated, set())
+
+        with self.assertRaises(ReturnTypeError):
+            result['b']
+
+    def test_dict_equality(self):
+        @type_enforcer(lazy_return=True)
+        def scores() -> dict[str, int]:
+            return {'a': 1}
+
+        self.assertEqual(scores(), {'a': 1})
+
+    def test_other_annotations_are_checked_eagerly(self):
+        @type_enforcer(lazy_return=True)
+        def pair() -> tuple[int, str]:
+            return 1, 2
+
+        with self.assertRaises(ReturnTypeError):
+            pair()
+
+        @type_enforcer(lazy_return=True)
+        def number() -> int:
+            return 1
+
+        self.assertEqual(number(), 1)
+
+    def test_wrong_container_type_is_rejected_eagerly(self):
+        @type_enforcer(lazy_return=True)
+        def values() -> list[int]:
+            return (1, 2)
+
+        with self.assertRaises(ReturnTypeError):
+            values()
+
+    def test_arguments_are_still_checked(self):
+        @type_enforcer(lazy_return=True)
+        def values(n: int) -> list[int]:
+            return [n]
+
+        with self.assertRaises(TypeError):
+            values('1')
+
+    def test_coerce_cannot_be_combined(self):
+        with self.assertRaises(ValueError):
+            @type_enforcer(coerce=True, lazy_return=True)
+            def values() -> list[int]:
+                return []
+
+    def test_warn_mode_reports_on_access(self):
+        reporter = type_enforcer.violations
+        reporter.pending.clear()
+
+        @type_enforcer(lazy_return=True, on_violation='warn')
+        def values() -> list[int]:
+            return [1, 'bad']
+
+        result = values()
+        self.assertEqual(reporter.snapshot(), [])
+        self.assertEqual(list(result), [1, 'bad'])
+        self.assertEqual([(v.parameter, v.actual_type) for v in reporter.snapshot()],
+                         [('return', str)])
+        reporter.pending.clear()
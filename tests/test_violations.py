@@ -0,0 +1,138 @@
+import os
+import signal
+import unittest
+
+from typeca import Violation, type_enforcer
+
+
+class TestViolationPolicies(unittest.TestCase):
+
+    def setUp(self):
+        self.reporter = type_enforcer.violations
+        self.reporter.pending.clear()
+        self.reporter.configure(interval=60.0)
+
+    def tearDown(self):
+        self.reporter.pending.clear()
+        self.reporter.callback = None
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            @type_enforcer(on_violation='ignore')
+            def add(a: int, b: int) -> int:
+                return a + b
+
+    def test_warn_does_not_raise(self):
+        @type_enforcer(on_violation='warn')
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        self.assertEqual(add('a', 'b'), 'ab')
+        self.assertEqual(add(1, 2), 3)
+
+    def test_violations_are_aggregated(self):
+        @type_enforcer(on_violation='warn')
+        def double(value: int) -> int:
+            return value * 2
+
+        for _ in range(1000):
+            double('a')
+        double(1.5)
+        double(2)
+
+        self.assertEqual(
+            {(v.function, v.parameter, v.expected_type, v.actual_type, v.count)
+             for v in self.reporter.snapshot()},
+            {(double.__wrapped__, 'value', int, str, 1000),
+             (double.__wrapped__, 'return', int, str, 1000),
+             (double.__wrapped__, 'value', int, float, 1),
+             (double.__wrapped__, 'return', int, float, 1)})
+
+    def test_flush_logs_aggregated_reports(self):
+        @type_enforcer(on_violation='warn')
+        def double(value: int) -> float:
+            return value * 2
+
+        for _ in range(500):
+            double(1)
+
+        with self.assertLogs('typeca', 'WARNING') as logs:
+            violations = self.reporter.flush()
+
+        self.assertEqual(len(violations), 1)
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("Return value of", logs.output[0])
+        self.assertIn("must be of type <class 'float'>, but got int (500 times)",
+                      logs.output[0])
+        self.assertEqual(self.reporter.snapshot(), [])
+
+    def test_callback_policy(self):
+        received = []
+        self.reporter.configure(callback=received.extend)
+
+        @type_enforcer(on_violation='callback')
+        def greet(name: str) -> str:
+            return f'Hello, {name}'
+
+        greet(1)
+        greet(2)
+        self.assertEqual(received, [])
+
+        self.reporter.flush()
+        self.assertEqual(received, [Violation(greet.__wrapped__, 'name', str, int, 2)])
+        self.assertEqual(str(received[0]).split(' of ')[0], "Argument 'name'")
+
+    def test_flush_is_rate_limited(self):
+        received = []
+        self.reporter.configure(interval=0.0, callback=received.extend)
+
+        @type_enforcer(on_violation='callback')
+        def greet(name: str) -> str:
+            return f'Hello, {name}'
+
+        greet(1)
+        self.assertEqual(len(received), 1)
+
+        self.reporter.configure(interval=60.0)
+        greet(1)
+        greet(1)
+        self.assertEqual(len(received), 1)
+        self.assertEqual(self.reporter.snapshot()[0].count, 2)
+
+    def test_failing_callback_does_not_break_the_call(self):
+        self.reporter.configure(interval=0.0, callback=lambda violations: 1 / 0)
+
+        @type_enforcer(on_violation='callback')
+        def greet(name: str) -> str:
+            return f'Hello, {name}'
+
+        with self.assertLogs('typeca', 'WARNING') as logs:
+            self.assertEqual(greet(1), 'Hello, 1')
+
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn('Type violation callback failed', logs.output[0])
+        self.assertIn('ZeroDivisionError', logs.output[0])
+        self.assertIn("Argument 'name' of", logs.output[1])
+
+    def test_warn_with_coerce(self):
+        @type_enforcer(coerce=True, on_violation='warn')
+        def double(value: int) -> int:
+            return value * 2
+
+        self.assertEqual(double('2'), 4)
+        self.assertEqual(double('x'), 'xx')
+        self.assertEqual([(v.parameter, v.count) for v in self.reporter.snapshot()],
+                         [('value', 1), ('return', 1)])
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_flush_lock_is_reset_in_forked_child(self):
+        with self.reporter._flush_lock:
+            pid = os.fork()
+            if pid == 0:
+                # Dies from SIGALRM instead of hanging if the lock is still held.
+                signal.alarm(5)
+                self.reporter.pending.clear()
+                self.reporter.flush()
+                os._exit(0)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
@@ -3,8 +3,13 @@ Typeca: A package for type enforcement in Python functions.
 """
 
 from typeca.decorator import TypeEnforcer
+from typeca.exceptions import ArgumentTypeError, ReturnTypeError, ValidationError
+from typeca.views import CheckedMapping, CheckedSequence
+from typeca.violations import Violation
 
 type_enforcer = TypeEnforcer()
+is_instance = type_enforcer.is_instance
+validate = type_enforcer.validate
 
 type_enforcer.__doc__ = """
 Typeca: A decorator for enforcing type checks on function args and return values.
@@ -15,6 +20,24 @@ Raises TypeError on type mismatches.
 Args:
     maxsize (int, default=64): Cache size for function signatures.
     enable (bool, default=True): Whether type enforcement is active.
+    coerce (bool, default=False): Convert compatible values to the annotated types
+        instead of rejecting them.
+    on_violation (str, default='raise'): 'raise' a TypeError on mismatches, or only
+        record them: 'warn' logs aggregated reports to the 'typeca' logger, 'callback'
+        passes them to the callback set with type_enforcer.violations.configure().
+    lazy_return (bool, default=False): Return a read-only view of returned lists, dicts
+        and tuple[T, ...] that checks items when they are read, instead of checking
+        every item on return.
 """
 
-__all__ = ['type_enforcer']
+__all__ = [
+    'type_enforcer',
+    'is_instance',
+    'validate',
+    'ArgumentTypeError',
+    'ReturnTypeError',
+    'ValidationError',
+    'Violation',
+    'CheckedMapping',
+    'CheckedSequence',
+]
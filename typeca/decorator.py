@@ -1,20 +1,101 @@
+import os
+import sys
+import typing
 from abc import ABC, abstractmethod
-from functools import lru_cache, wraps
-from inspect import Signature, signature
-from typing import Any, Type, Union, get_args, get_origin
-
-from .exceptions import ArgumentTypeError, ReturnTypeError
+from collections.abc import Mapping, Sequence
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import lru_cache, update_wrapper
+from inspect import Parameter, Signature, signature, unwrap
+from itertools import chain, repeat
+from operator import itemgetter
+from threading import Lock
+from types import MethodType, UnionType
+from typing import (Annotated, Any, Callable, ForwardRef, Literal, Type, Union, get_args,
+                    get_origin, get_type_hints, is_typeddict)
+from weakref import WeakSet
+
+from .exceptions import ArgumentTypeError, ReturnTypeError, ValidationError
+from .views import CheckedMapping, CheckedSequence
+from .violations import VIOLATION_POLICIES, ViolationReporter
+
+
+# PEP 695 ``type X = ...`` aliases, Python 3.12+.
+TypeAliasType = getattr(typing, 'TypeAliasType', None)
+
+# Type qualifiers that don't change what values are accepted: ``Annotated[int, ...]``
+# accepts what ``int`` does.
+QUALIFIERS = tuple(getattr(typing, name) for name in
+                   ('Annotated', 'ClassVar', 'Final', 'Required', 'NotRequired', 'ReadOnly')
+                   if hasattr(typing, name))
+
+# Modes of the nodes expanded by check_iteratively().
+ALL = 0
+ANY = 1
 
 
 class TypeChecker(ABC):
+    __slots__ = ()
+
     @abstractmethod
-    def check_type(self, value: Any, expected_type: Type) -> bool:
+    def check_type(self, value: Any) -> bool:
         pass
 
+    def expand(self, value: Any) -> bool | tuple[int, Any]:
+        """
+        One step of check_iteratively(): either the result for ``value`` or ``(mode, pairs)``.
+
+        ``pairs`` is an iterator of ``(checker, value)`` that must ``ALL`` match, or of which
+        ``ANY`` must match. Checkers that don't expand are run as a whole.
+        """
+        return bool(self.check_type(value))
+
+    def make_view(self, value: Any, return_type: Type,
+                  report: Callable | None = None) -> Mapping | Sequence | None:
+        """
+        Wrap a returned value into a view checking its items on access, if supported.
+
+        Returns None when the value can't be checked lazily and must be checked as a whole.
+        """
+        return None
+
+    def children(self) -> tuple['TypeChecker', ...]:
+        """
+        Checkers this one delegates to, compiling them first if they are compiled lazily.
+
+        Used by resolve_checkers() to finish compiling a checker graph ahead of use.
+        """
+        return ()
+
+    def coerce(self, value: Any) -> Any:
+        """
+        Return ``value`` converted to the expected type.
+
+        Values that already match are returned as is, so coercion only allocates when a
+        conversion is actually needed. Raises TypeError or ValueError if ``value`` can't be
+        converted.
+        """
+        if self.check_type(value):
+            return value
+        raise TypeError(f'Cannot coerce {type(value).__name__}')
+
+    def expand_coercion(self, value: Any, memo: dict) -> tuple[int, Any, Callable]:
+        """
+        One step of coerce_iteratively(): ``(mode, pairs, build)``.
+
+        ``pairs`` is an iterator of ``(checker, value)`` that must ``ALL`` be converted, or
+        of which the first one that can be is used (``ANY``). ``build`` makes the result from
+        the list of converted values. Checkers that don't expand are coerced as a whole.
+        """
+        return ALL, iter(()), lambda coerced: self.coerce(value)
+
 
 class TypeCheckerFactory(ABC):
+    # Namespace forward references are resolved in, if any.
+    globalns = None
+
     @abstractmethod
-    def get_checker(self, expected_type: Type) -> TypeChecker:
+    def get_checker(self, expected_type: Type, globalns: dict | None = None) -> TypeChecker:
         pass
 
 
@@ -24,12 +105,33 @@ class SignatureHelperFactory(ABC):
         pass
 
     @abstractmethod
-    def check_args_types(self, func, hints: dict[str, Type], sig: Signature, args: tuple,
-                         kwargs: dict):
+    def compile_signature(self, hints: dict[str, Type], sig: Signature,
+                          globalns: dict | None = None) -> 'CompiledSignature':
         pass
 
     @abstractmethod
-    def check_return_type(self, result: Any, return_type: Type):
+    def check_args_types(self, compiled: 'CompiledSignature', args: tuple, kwargs: dict,
+                         report: Callable | None = None):
+        pass
+
+    @abstractmethod
+    def check_return_type(self, result: Any, compiled: 'CompiledSignature',
+                          report: Callable | None = None):
+        pass
+
+    @abstractmethod
+    def coerce_args_types(self, compiled: 'CompiledSignature', args: tuple, kwargs: dict,
+                          report: Callable | None = None) -> tuple[tuple, dict]:
+        pass
+
+    @abstractmethod
+    def coerce_return_type(self, result: Any, compiled: 'CompiledSignature',
+                           report: Callable | None = None) -> Any:
+        pass
+
+    @abstractmethod
+    def check_return_type_lazily(self, result: Any, compiled: 'CompiledSignature',
+                                 report: Callable | None = None) -> Any:
         pass
 
 
@@ -49,107 +151,925 @@ class SignatureInfoInterface(ABC):
 
 class ArgsTypeCheckerInterface(ABC):
     @abstractmethod
-    def check_args_types(self, func, hints: dict[str, Type], sig: Signature, args: tuple,
-                         kwargs: dict):
+    def check_args_types(self, compiled: 'CompiledSignature', args: tuple, kwargs: dict,
+                         report: Callable | None = None):
+        pass
+
+    @abstractmethod
+    def coerce_args_types(self, compiled: 'CompiledSignature', args: tuple, kwargs: dict,
+                          report: Callable | None = None) -> tuple[tuple, dict]:
         pass
 
 
 class ReturnTypeCheckerInterface(ABC):
     @abstractmethod
-    def check_return_type(self, result: Any, return_type: Type):
+    def check_return_type(self, result: Any, compiled: 'CompiledSignature',
+                          report: Callable | None = None):
         pass
 
+    @abstractmethod
+    def coerce_return_type(self, result: Any, compiled: 'CompiledSignature',
+                           report: Callable | None = None) -> Any:
+        pass
 
-class StandardTypeChecker(TypeChecker):
-    def check_type(self, value: Any, expected_type: Type) -> bool:
-        origin_type = get_origin(expected_type)
-        if origin_type is None:
-            return isinstance(value, expected_type)
+    @abstractmethod
+    def check_return_type_lazily(self, result: Any, compiled: 'CompiledSignature',
+                                 report: Callable | None = None) -> Any:
+        pass
+
+
+def coerce_int(value: Any) -> int:
+    if isinstance(value, str):
+        return int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise TypeError(f'Cannot coerce {type(value).__name__} to int')
+
+
+def coerce_float(value: Any) -> float:
+    if isinstance(value, (int, str)) and not isinstance(value, bool):
+        return float(value)
+    raise TypeError(f'Cannot coerce {type(value).__name__} to float')
+
+
+BOOL_STRINGS = {'true': True, '1': True, 'yes': True, 'on': True,
+                'false': False, '0': False, 'no': False, 'off': False}
+
+
+def coerce_bool(value: Any) -> bool:
+    if isinstance(value, str) and value.lower() in BOOL_STRINGS:
+        return BOOL_STRINGS[value.lower()]
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    raise TypeError(f'Cannot coerce {type(value).__name__} to bool')
+
+
+SCALAR_COERCERS = {int: coerce_int, float: coerce_float, bool: coerce_bool}
+
+COERCIBLE_ARRAYS = (list, tuple, set, frozenset)
+
+
+def has_forward_refs(expected_type: Any) -> bool:
+    """Whether an annotation refers to names by string, e.g. ``list['Node']``."""
+    if isinstance(expected_type, (str, ForwardRef)):
+        return True
+    origin = get_origin(expected_type)
+    if origin is Literal:
+        return False
+    args = get_args(expected_type)
+    if origin is Annotated:
+        args = args[:1]
+    return any(has_forward_refs(arg) for arg in args)
+
+
+def cache_key(expected_type: Any) -> Any:
+    """
+    Key of an annotation in the checker caches.
+
+    Unions compare equal whatever the order of their members (``int | float == float |
+    int``), but coercion tries the members in order, so the arguments of an annotation
+    are part of its key, in order and at every level.
+    """
+    args = getattr(expected_type, '__args__', None)
+    if not args or not isinstance(args, tuple):
+        return expected_type
+    return expected_type, tuple(map(cache_key, args))
+
+
+def check_iteratively(checker: TypeChecker, value: Any, memo: dict | None = None) -> bool:
+    """
+    Run a checker with an explicit stack instead of recursing into nested values.
+
+    Used for recursive types, where the payload depth isn't bounded by the annotation:
+    the Python stack doesn't grow with nesting. A (checker, value) pair met again while
+    it is still being checked means the data is cyclic; it is assumed to match, so that
+    self-referencing containers terminate.
+
+    ``memo`` keeps the results of expanded pairs across calls made while coercing one
+    value, so that the unions met at every level don't check the same subtree again.
+    Results are only kept until the data turns out to be cyclic, since later ones may
+    rely on that assumption.
+    """
+    stack = []
+    active = set()
+    pending = (checker, value)
+    result = None
+
+    while True:
+        checker, value = pending
+        key = (id(checker), id(value))
+        if key in active:
+            result = True
+            memo = None
+        elif memo is not None and key in memo:
+            result = memo[key][0]
+        else:
+            outcome = checker.expand(value)
+            if outcome.__class__ is bool:
+                result = outcome
+            else:
+                active.add(key)
+                stack.append((outcome[0], outcome[1], key, value))
+                result = None
+
+        while stack:
+            mode, pairs, key, value = stack[-1]
+            # ALL goes on while children match, ANY while they don't.
+            if result is None or result is (mode == ALL):
+                pending = next(pairs, None)
+                if pending is not None:
+                    break
+                result = mode == ALL
+            stack.pop()
+            active.discard(key)
+            if memo is not None:
+                # The value is kept alive so that its id isn't reused for another one.
+                memo[key] = (result, value)
+        else:
+            return result
+
+
+def coerce_iteratively(checker: TypeChecker, value: Any) -> Any:
+    """
+    Run a checker's coercion with an explicit stack instead of recursing into nested values.
+
+    Counterpart of check_iteratively() for recursive types. A failed conversion unwinds to
+    the innermost ``ANY`` node (a union), which goes on with its next member. Raises
+    TypeError or ValueError if ``value`` can't be converted, including when converting it
+    would need a self-referencing value to be converted while it is being converted.
+    """
+    stack = []
+    active = set()
+    memo = {}
+    pending = (checker, value)
+    result = None
+
+    while True:
+        checker, value = pending
+        key = (id(checker), id(value))
+        error = None
+        try:
+            if key in active:
+                raise TypeError(f'Cannot coerce self-referencing {type(value).__name__}')
+            mode, pairs, build = checker.expand_coercion(value, memo)
+        except (TypeError, ValueError) as err:
+            error = err
+        else:
+            active.add(key)
+            stack.append((mode, pairs, build, [], key))
+        # Whether the top node goes on with its next pair: right after it was expanded, or
+        # when its last pair was converted (ALL) or failed (ANY).
+        go_on = error is None
+
+        while stack:
+            mode, pairs, build, coerced, key = stack[-1]
+            if not go_on and (error is None) is (mode == ALL):
+                if error is None:
+                    coerced.append(result)
+                go_on = True
+                error = None
+            if go_on:
+                pending = next(pairs, None)
+                if pending is not None:
+                    break
+                try:
+                    result = build(coerced)
+                except (TypeError, ValueError) as err:
+                    error = err
+            stack.pop()
+            active.discard(key)
+            go_on = False
+        else:
+            if error is not None:
+                raise error
+            return result
+
+
+def unchanged(coerced: list, values) -> bool:
+    """Whether coercion returned every value as is."""
+    return all(c is v for c, v in zip(coerced, values))
+
+
+def keep(value: Any) -> tuple[int, Any, Callable]:
+    """expand_coercion() result of a value that already matches."""
+    return ALL, iter(()), lambda coerced: value
+
+
+def resolve_checkers(checkers: list[TypeChecker], seen: set[int] | None = None):
+    """
+    Compile the lazily compiled parts of checker graphs: record fields and references.
+
+    Each checker is visited once, so cyclic graphs terminate, and the walk uses an explicit
+    stack. Parts that can't be compiled yet (a name that isn't defined at this point) or
+    fail to compile are left to be compiled on first use, where the error is raised.
+    """
+    if seen is None:
+        seen = set()
+    stack = list(checkers)
+    while stack:
+        checker = stack.pop()
+        if id(checker) in seen:
+            continue
+        seen.add(id(checker))
+        try:
+            stack.extend(checker.children())
+        except Exception:
+            continue
+
+
+class AnyChecker(TypeChecker):
+    __slots__ = ()
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
+        pass
+
+    def check_type(self, value: Any) -> bool:
         return True
 
 
+class StandardTypeChecker(TypeChecker):
+    """
+    Checks that the value is an instance of the expected class.
+
+    Generics without a registered checker (e.g. ``Sequence[int]``) are checked against their
+    origin class only; those whose origin isn't a class can't be checked and are rejected
+    when compiled.
+    """
+
+    __slots__ = ('expected_type',)
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
+        origin = get_origin(expected_type)
+        if origin is not None:
+            if not isinstance(origin, type):
+                raise TypeError(f'Unsupported annotation: {expected_type!r}')
+            expected_type = origin
+        self.expected_type = expected_type
+
+    def check_type(self, value: Any) -> bool:
+        return isinstance(value, self.expected_type)
+
+    def coerce(self, value: Any) -> Any:
+        if self.check_type(value):
+            return value
+        expected_type = self.expected_type
+        coerce_scalar = SCALAR_COERCERS.get(expected_type)
+        if coerce_scalar is not None:
+            return coerce_scalar(value)
+        if isinstance(expected_type, type) and issubclass(expected_type, Enum):
+            return expected_type(value)
+        raise TypeError(f'Cannot coerce {type(value).__name__} to {expected_type}')
+
+
+class LiteralChecker(TypeChecker):
+    __slots__ = ('values',)
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
+        # Values are matched with their type, as type checkers do: Literal[1] rejects True.
+        self.values = frozenset((type(v), v) for v in get_args(expected_type))
+
+    def check_type(self, value: Any) -> bool:
+        try:
+            return (type(value), value) in self.values
+        except TypeError:
+            # Unhashable values can't be equal to any literal.
+            return False
+
+
+class SubclassChecker(TypeChecker):
+    """Checks ``type[C]``: the value must be C or a subclass of it."""
+
+    __slots__ = ('expected_cls',)
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
+        args = get_args(expected_type)
+        cls = args[0] if args else Any
+        # type[Any] and arguments that aren't classes (type[int | str]) accept any class.
+        self.expected_cls = cls if isinstance(cls, type) and cls is not Any else object
+
+    def check_type(self, value: Any) -> bool:
+        return isinstance(value, type) and issubclass(value, self.expected_cls)
+
+
 class BaseArrayChecker(TypeChecker):
-    def __init__(self, factory: TypeCheckerFactory, expected_cls: Type):
-        self.factory = factory
-        self.expected_cls = expected_cls
+    __slots__ = ('expected_cls', 'elem_checker')
 
-    def check_type(self, value: Any, expected_type: Type) -> bool:
-        elem_type = get_args(expected_type)[0]
-        checker = self.factory.get_checker(elem_type)
-        return all(checker.check_type(v, elem_type) for v in value)
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type, expected_cls: Type):
+        self.expected_cls = expected_cls
+        # Bare typing.List/Set/FrozenSet: elements of any type.
+        args = get_args(expected_type) or (Any,)
+        self.elem_checker = factory.get_checker(args[0])
+
+    def check_type(self, value: Any) -> bool:
+        if not isinstance(value, self.expected_cls):
+            return False
+        check = self.elem_checker.check_type
+        return all(check(v) for v in value)
+
+    def expand(self, value: Any) -> bool | tuple[int, Any]:
+        if not isinstance(value, self.expected_cls):
+            return False
+        return ALL, zip(repeat(self.elem_checker), value)
+
+    def children(self) -> tuple[TypeChecker, ...]:
+        return (self.elem_checker,)
+
+    def coerce(self, value: Any) -> Any:
+        if isinstance(value, self.expected_cls) and self.check_type(value):
+            return value
+        if not isinstance(value, COERCIBLE_ARRAYS):
+            raise TypeError(f'Cannot coerce {type(value).__name__} to {self.expected_cls}')
+        coerce = self.elem_checker.coerce
+        return self.expected_cls(coerce(v) for v in value)
+
+    def expand_coercion(self, value: Any, memo: dict) -> tuple[int, Any, Callable]:
+        expected_cls = self.expected_cls
+        if not isinstance(value, COERCIBLE_ARRAYS):
+            raise TypeError(f'Cannot coerce {type(value).__name__} to {expected_cls}')
+        values = list(value)
+
+        def build(coerced: list) -> Any:
+            if isinstance(value, expected_cls) and unchanged(coerced, values):
+                return value
+            return expected_cls(coerced)
+
+        return ALL, zip(repeat(self.elem_checker), values), build
 
 
 class ListChecker(BaseArrayChecker):
-    def __init__(self, factory: TypeCheckerFactory):
-        super().__init__(factory, list)
+    __slots__ = ()
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
+        super().__init__(factory, expected_type, list)
+
+    def make_view(self, value: Any, return_type: Type,
+                  report: Callable | None = None) -> Mapping | Sequence | None:
+        if not isinstance(value, list):
+            return None
+        return CheckedSequence(value, self.elem_checker, return_type, report)
 
 
 class SetChecker(BaseArrayChecker):
-    def __init__(self, factory: TypeCheckerFactory):
-        super().__init__(factory, set)
+    __slots__ = ()
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
+        super().__init__(factory, expected_type, set)
 
 
 class FrozenSetChecker(BaseArrayChecker):
-    def __init__(self, factory: TypeCheckerFactory):
-        super().__init__(factory, frozenset)
+    __slots__ = ()
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
+        super().__init__(factory, expected_type, frozenset)
 
 
 class DictChecker(TypeChecker):
-    def __init__(self, factory: TypeCheckerFactory):
+    __slots__ = ('key_checker', 'value_checker')
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
+        # Bare typing.Dict: keys and values of any type.
+        key_type, value_type = get_args(expected_type) or (Any, Any)
+        self.key_checker = factory.get_checker(key_type)
+        self.value_checker = factory.get_checker(value_type)
+
+    def check_type(self, value: Any) -> bool:
+        if not isinstance(value, dict):
+            return False
+        check_key = self.key_checker.check_type
+        check_value = self.value_checker.check_type
+        return all(check_key(key) for key in value) and \
+            all(check_value(v) for v in value.values())
+
+    def expand(self, value: Any) -> bool | tuple[int, Any]:
+        if not isinstance(value, dict):
+            return False
+        key_checker = self.key_checker
+        value_checker = self.value_checker
+        return ALL, chain.from_iterable(((key_checker, key), (value_checker, v))
+                                        for key, v in value.items())
+
+    def children(self) -> tuple[TypeChecker, ...]:
+        return self.key_checker, self.value_checker
+
+    def make_view(self, value: Any, return_type: Type,
+                  report: Callable | None = None) -> Mapping | Sequence | None:
+        if not isinstance(value, dict):
+            return None
+        return CheckedMapping(value, self.key_checker, self.value_checker, return_type, report)
+
+    def coerce(self, value: Any) -> Any:
+        if isinstance(value, dict) and self.check_type(value):
+            return value
+        if not isinstance(value, Mapping):
+            raise TypeError(f'Cannot coerce {type(value).__name__} to dict')
+        coerce_key = self.key_checker.coerce
+        coerce_value = self.value_checker.coerce
+        return {coerce_key(key): coerce_value(v) for key, v in value.items()}
+
+    def expand_coercion(self, value: Any, memo: dict) -> tuple[int, Any, Callable]:
+        if not isinstance(value, Mapping):
+            raise TypeError(f'Cannot coerce {type(value).__name__} to dict')
+        items = list(chain.from_iterable(value.items()))
+        checkers = (self.key_checker, self.value_checker) * (len(items) // 2)
+
+        def build(coerced: list) -> Any:
+            if isinstance(value, dict) and unchanged(coerced, items):
+                return value
+            return dict(zip(coerced[::2], coerced[1::2]))
+
+        return ALL, zip(checkers, items), build
+
+
+class TupleChecker(TypeChecker):
+    __slots__ = ('elem_checkers', 'variadic')
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
+        # Bare typing.Tuple is tuple[Any, ...]; tuple[()] is the empty tuple.
+        args = (Any, ...) if expected_type is typing.Tuple else get_args(expected_type)
+        # tuple[T, ...]: any length, every element of type T.
+        self.variadic = len(args) == 2 and args[1] is Ellipsis
+        if self.variadic:
+            args = args[:1]
+        self.elem_checkers = tuple(factory.get_checker(t) for t in args)
+
+    def check_type(self, value: Any) -> bool:
+        if not isinstance(value, tuple):
+            return False
+        checkers = self.elem_checkers
+        if self.variadic:
+            check = checkers[0].check_type
+            return all(check(v) for v in value)
+        return len(checkers) == len(value) and \
+            all(c.check_type(v) for v, c in zip(value, checkers))
+
+    def expand(self, value: Any) -> bool | tuple[int, Any]:
+        if not isinstance(value, tuple):
+            return False
+        checkers = self.elem_checkers
+        if self.variadic:
+            return ALL, zip(repeat(checkers[0]), value)
+        if len(checkers) != len(value):
+            return False
+        return ALL, zip(checkers, value)
+
+    def children(self) -> tuple[TypeChecker, ...]:
+        return self.elem_checkers
+
+    def make_view(self, value: Any, return_type: Type,
+                  report: Callable | None = None) -> Mapping | Sequence | None:
+        # Fixed-size tuples are short and mixed-type: only tuple[T, ...] gets a view.
+        if not self.variadic or not isinstance(value, tuple):
+            return None
+        return CheckedSequence(value, self.elem_checkers[0], return_type, report)
+
+    def coerce(self, value: Any) -> Any:
+        if self.check_type(value):
+            return value
+        checkers = self.elem_checkers
+        if not isinstance(value, (list, tuple)):
+            raise TypeError(f'Cannot coerce {type(value).__name__} to tuple')
+        if self.variadic:
+            coerce = checkers[0].coerce
+            return tuple(coerce(v) for v in value)
+        if len(checkers) != len(value):
+            raise TypeError(f'Cannot coerce {len(value)} items to a {len(checkers)}-tuple')
+        return tuple(c.coerce(v) for v, c in zip(value, checkers))
+
+    def expand_coercion(self, value: Any, memo: dict) -> tuple[int, Any, Callable]:
+        checkers = self.elem_checkers
+        if not isinstance(value, (list, tuple)):
+            raise TypeError(f'Cannot coerce {type(value).__name__} to tuple')
+        if self.variadic:
+            checkers = checkers * len(value)
+        elif len(checkers) != len(value):
+            raise TypeError(f'Cannot coerce {len(value)} items to a {len(checkers)}-tuple')
+
+        def build(coerced: list) -> Any:
+            if isinstance(value, tuple) and unchanged(coerced, value):
+                return value
+            return tuple(coerced)
+
+        return ALL, zip(checkers, value), build
+
+
+class UnionChecker(TypeChecker):
+    __slots__ = ('accepts_none', 'checkers')
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
+        args = get_args(expected_type)
+        self.accepts_none = type(None) in args
+        self.checkers = tuple(factory.get_checker(t) for t in args)
+
+    def check_type(self, value: Any) -> bool:
+        if value is None and self.accepts_none:
+            return True
+        return any(c.check_type(value) for c in self.checkers)
+
+    def expand(self, value: Any) -> bool | tuple[int, Any]:
+        if value is None and self.accepts_none:
+            return True
+        return ANY, zip(self.checkers, repeat(value))
+
+    def children(self) -> tuple[TypeChecker, ...]:
+        return self.checkers
+
+    def coerce(self, value: Any) -> Any:
+        if self.check_type(value):
+            return value
+        for checker in self.checkers:
+            try:
+                return checker.coerce(value)
+            except (TypeError, ValueError):
+                continue
+        raise TypeError(f'Cannot coerce {type(value).__name__} to any member of the union')
+
+    def expand_coercion(self, value: Any, memo: dict) -> tuple[int, Any, Callable]:
+        if (value is None and self.accepts_none) or check_iteratively(self, value, memo):
+            return keep(value)
+
+        def build(coerced: list) -> Any:
+            raise TypeError(f'Cannot coerce {type(value).__name__} to any member of the union')
+
+        return ANY, zip(self.checkers, repeat(value)), build
+
+
+class BaseFieldsChecker(TypeChecker):
+    """
+    Base checker for record types whose fields are described by annotations.
+
+    Field checkers are compiled on first use (or by ``prewarm()``) rather than with the
+    record checker itself, so that records referring to themselves don't recurse at
+    compile time. Such records compile into a cyclic checker graph, so nested values are
+    checked with check_iteratively() and coerced with coerce_iteratively(), like those of
+    recursive aliases.
+    """
+
+    __slots__ = ('factory', 'expected_type', 'field_checkers')
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
         self.factory = factory
+        self.expected_type = expected_type
+        self.field_checkers = None
 
-    def check_type(self, value: Any, expected_type: Type) -> bool:
-        key_type, value_type = get_args(expected_type)
-        key_checker = self.factory.get_checker(key_type)
-        value_checker = self.factory.get_checker(value_type)
-        return all(key_checker.check_type(key, key_type) for key in value) and \
-            all(value_checker.check_type(v, value_type) for v in value.values())
+    def _get_field_checkers(self) -> dict[str, TypeChecker]:
+        field_checkers = self.field_checkers
+        if field_checkers is None:
+            # get_type_hints() leaves strings nested in builtin generics (list['Tree']) as
+            # they are before Python 3.11: they resolve in the record's module.
+            module = sys.modules.get(self.expected_type.__module__)
+            globalns = getattr(module, '__dict__', None)
+            field_checkers = self.field_checkers = {
+                name: self.factory.get_checker(field_type, globalns)
+                for name, field_type in self._get_field_types().items()
+            }
+        return field_checkers
 
+    def children(self) -> tuple[TypeChecker, ...]:
+        return tuple(self._get_field_checkers().values())
 
-class TupleChecker(TypeChecker):
-    def __init__(self, factory: TypeCheckerFactory):
+    def _get_field_types(self) -> dict[str, Type]:
+        return get_type_hints(self.expected_type)
+
+    def _expand_fields(self, value: Mapping, make: Callable) -> tuple[int, Any, Callable]:
+        """expand_coercion() of the fields; ``make`` turns the converted fields into the result."""
+        field_checkers = self._get_field_checkers()
+        keys = [key for key in value if key in field_checkers]
+        values = [value[key] for key in keys]
+
+        def build(coerced: list) -> Any:
+            if isinstance(value, dict) and unchanged(coerced, values):
+                return make(value)
+            return make({**value, **dict(zip(keys, coerced))})
+
+        return ALL, zip(map(field_checkers.__getitem__, keys), values), build
+
+
+class TypedDictChecker(BaseFieldsChecker):
+    __slots__ = ('required_keys',)
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
+        super().__init__(factory, expected_type)
+        self.required_keys = expected_type.__required_keys__
+
+    def check_type(self, value: Any) -> bool:
+        return check_iteratively(self, value)
+
+    def expand(self, value: Any) -> bool | tuple[int, Any]:
+        if not isinstance(value, dict) or not self.required_keys <= value.keys():
+            return False
+        return ALL, ((checker, value[key])
+                     for key, checker in self._get_field_checkers().items() if key in value)
+
+    def coerce(self, value: Any) -> Any:
+        return coerce_iteratively(self, value)
+
+    def expand_coercion(self, value: Any, memo: dict) -> tuple[int, Any, Callable]:
+        if not isinstance(value, Mapping) or not self.required_keys <= value.keys():
+            raise TypeError(f'Cannot coerce {type(value).__name__} to {self.expected_type}')
+        return self._expand_fields(value, lambda fields: fields)
+
+
+class DataclassChecker(BaseFieldsChecker):
+    __slots__ = ()
+
+    def check_type(self, value: Any) -> bool:
+        return isinstance(value, self.expected_type)
+
+    def _get_field_types(self) -> dict[str, Type]:
+        field_types = get_type_hints(self.expected_type)
+        return {f.name: field_types[f.name] for f in fields(self.expected_type)
+                if f.init and f.name in field_types}
+
+    def coerce(self, value: Any) -> Any:
+        if isinstance(value, self.expected_type):
+            return value
+        return coerce_iteratively(self, value)
+
+    def expand_coercion(self, value: Any, memo: dict) -> tuple[int, Any, Callable]:
+        if isinstance(value, self.expected_type):
+            return keep(value)
+        if not isinstance(value, Mapping):
+            raise TypeError(f'Cannot coerce {type(value).__name__} to {self.expected_type}')
+        return self._expand_fields(value, lambda fields: self.expected_type(**fields))
+
+
+class BaseReferenceChecker(TypeChecker):
+    """
+    Base checker for annotations that refer to another one, possibly recursively.
+
+    The factory only keeps these for references closing a cycle or whose name isn't
+    defined yet: others compile straight into the checker of what they name.
+
+    The target is compiled on first use (or by ``prewarm()``) through the factory cache,
+    so a recursive type compiles into a cyclic checker graph rather than recursing forever.
+    Values are checked with check_iteratively() and coerced with coerce_iteratively(), so
+    deeply nested or cyclic data doesn't exhaust the stack.
+    """
+
+    __slots__ = ('factory', 'expected_type', 'target')
+
+    def __init__(self, factory: TypeCheckerFactory, expected_type: Type):
         self.factory = factory
+        self.expected_type = expected_type
+        self.target = None
 
-    def check_type(self, value: Any, expected_type: Type) -> bool:
-        expected_types = get_args(expected_type)
-        return isinstance(value, tuple) and len(expected_types) == len(value) and \
-            all(self.factory.get_checker(t).check_type(v, t) for v, t in zip(value, expected_types))
+    @abstractmethod
+    def _resolve(self) -> Type:
+        pass
 
+    def get_target(self) -> TypeChecker:
+        target = self.target
+        if target is None:
+            target = self.target = self.factory.get_checker(self._resolve())
+        return target
 
-class UnionChecker(TypeChecker):
-    def __init__(self, factory: TypeCheckerFactory):
+    def check_type(self, value: Any) -> bool:
+        return check_iteratively(self, value)
+
+    def expand(self, value: Any) -> bool | tuple[int, Any]:
+        return ALL, iter(((self.get_target(), value),))
+
+    def children(self) -> tuple[TypeChecker, ...]:
+        return (self.get_target(),)
+
+    def coerce(self, value: Any) -> Any:
+        return coerce_iteratively(self, value)
+
+    def expand_coercion(self, value: Any, memo: dict) -> tuple[int, Any, Callable]:
+        return ALL, iter(((self.get_target(), value),)), itemgetter(0)
+
+
+class ForwardRefChecker(BaseReferenceChecker):
+    __slots__ = ()
+
+    def _resolve(self) -> Type:
+        ref = self.expected_type
+        if isinstance(ref, str):
+            name, module = ref, None
+        else:
+            name, module = ref.__forward_arg__, ref.__forward_module__
+        globalns = sys.modules[module].__dict__ if module else self.factory.globalns
+        if globalns is None:
+            raise NameError(f"Cannot resolve forward reference {name!r}: no namespace given")
+        return eval(name, globalns)
+
+
+class TypeAliasChecker(BaseReferenceChecker):
+    __slots__ = ()
+
+    def _resolve(self) -> Type:
+        return self.expected_type.__value__
+
+
+class ScopedTypeCheckerFactory(TypeCheckerFactory):
+    """Compiles annotations whose forward references resolve in the given namespace."""
+
+    __slots__ = ('factory', 'globalns')
+
+    def __init__(self, factory: 'DefaultTypeCheckerFactory', globalns: dict):
         self.factory = factory
+        self.globalns = globalns
 
-    def check_type(self, value: Any, expected_type: Type) -> bool:
-        if value is None and type(None) in get_args(expected_type):
-            return True
-        return any(
-            self.factory.get_checker(t).check_type(value, t) for t in get_args(expected_type))
+    def get_checker(self, expected_type: Type, globalns: dict | None = None) -> TypeChecker:
+        return self.factory.get_checker(expected_type, globalns or self.globalns)
 
 
 class DefaultTypeCheckerFactory(TypeCheckerFactory):
+    """
+    Compiles annotations into checker trees.
+
+    Checkers are registered per origin type (``list``, ``dict``, ``Union``...) and are built
+    once per annotation: nested checkers are resolved at compile time, so validating a
+    value never goes back to the factory. Annotations are cached by cache_key(), which
+    tells union member orders apart. Annotations with string forward references are
+    cached per namespace, since the same string may name different types in two modules.
+    """
+
     def __init__(self):
         self.checkers = {}
+        self.compiled = {}
+        # Last annotation object compiled per (order-insensitive) annotation, with its
+        # checker: annotations are usually the same objects call after call, and this skips
+        # computing their cache_key().
+        self.last_compiled = {}
+        self.scoped = {}
+        self.forward_refs = {}
+        # ids of the annotations being compiled, with how many times each is: a reference
+        # resolving to one of them closes a cycle.
+        self.building = {}
         self._register_builtin_checkers()
 
     def _register_builtin_checkers(self):
-        self.register_checker(list, ListChecker(self))
-        self.register_checker(dict, DictChecker(self))
-        self.register_checker(tuple, TupleChecker(self))
-        self.register_checker(set, SetChecker(self))
-        self.register_checker(frozenset, FrozenSetChecker(self))
-        self.register_checker(Union, UnionChecker(self))
+        self.register_checker(list, ListChecker)
+        self.register_checker(dict, DictChecker)
+        self.register_checker(tuple, TupleChecker)
+        self.register_checker(set, SetChecker)
+        self.register_checker(frozenset, FrozenSetChecker)
+        self.register_checker(Union, UnionChecker)
+        self.register_checker(UnionType, UnionChecker)
+        self.register_checker(Literal, LiteralChecker)
+        self.register_checker(type, SubclassChecker)
+
+    def register_checker(self, type_key: Type | Any, checker_cls: type[TypeChecker]):
+        self.checkers[type_key] = checker_cls
+        self.compiled.clear()
+        self.last_compiled.clear()
+        self.scoped.clear()
+
+    def get_checker(self, expected_type: Type, globalns: dict | None = None) -> TypeChecker:
+        if globalns is not None and self._has_forward_refs(expected_type):
+            return self._get_scoped_checker(expected_type, globalns)
+        try:
+            last = self.last_compiled.get(expected_type)
+        except TypeError:
+            # Unhashable annotation (e.g. Annotated with a dict): compile without caching.
+            return self._build_checker(expected_type, self)
+        if last is not None and last[0] is expected_type:
+            return last[1]
+        key = cache_key(expected_type)
+        checker = self.compiled.get(key)
+        if checker is None:
+            checker = self._build_checker(expected_type, self)
+            if isinstance(checker, BaseReferenceChecker):
+                # Kept because it closes a cycle or isn't defined yet: compiled again
+                # next time, when the same annotation may resolve directly.
+                return checker
+            self.compiled[key] = checker
+        self.last_compiled[expected_type] = (expected_type, checker)
+        return checker
+
+    def _get_scoped_checker(self, expected_type: Type, globalns: dict) -> TypeChecker:
+        factory = ScopedTypeCheckerFactory(self, globalns)
+        key = (cache_key(expected_type), id(globalns))
+        try:
+            return self.scoped[key]
+        except KeyError:
+            checker = self._build_checker(expected_type, factory)
+            if not isinstance(checker, BaseReferenceChecker):
+                self.scoped[key] = checker
+            return checker
+        except TypeError:
+            return self._build_checker(expected_type, factory)
+
+    def _has_forward_refs(self, expected_type: Type) -> bool:
+        try:
+            return self.forward_refs[expected_type]
+        except KeyError:
+            result = self.forward_refs[expected_type] = has_forward_refs(expected_type)
+            return result
+        except TypeError:
+            return has_forward_refs(expected_type)
+
+    def _build_checker(self, expected_type: Type, factory: TypeCheckerFactory) -> TypeChecker:
+        if expected_type is None:
+            expected_type = type(None)
+        origin = get_origin(expected_type)
+        if origin in QUALIFIERS:
+            return factory.get_checker(get_args(expected_type)[0])
+        checker_cls = self.checkers.get(origin)
+        if checker_cls is None:
+            if isinstance(expected_type, (str, ForwardRef)):
+                checker_cls = ForwardRefChecker
+            elif TypeAliasType is not None and isinstance(expected_type, TypeAliasType):
+                checker_cls = TypeAliasChecker
+            elif expected_type is Any:
+                checker_cls = AnyChecker
+            elif is_typeddict(expected_type):
+                checker_cls = TypedDictChecker
+            elif isinstance(expected_type, type) and is_dataclass(expected_type):
+                checker_cls = DataclassChecker
+            else:
+                checker_cls = StandardTypeChecker
+
+        building = self.building
+        marker = id(expected_type)
+        building[marker] = building.get(marker, 0) + 1
+        try:
+            checker = checker_cls(factory, expected_type)
+            if isinstance(checker, BaseReferenceChecker):
+                checker = self._resolve_reference(checker, factory)
+        finally:
+            count = building.pop(marker) - 1
+            if count:
+                building[marker] = count
+        return checker
+
+    def _resolve_reference(self, checker: 'BaseReferenceChecker',
+                           factory: TypeCheckerFactory) -> TypeChecker:
+        """
+        Compile the annotation a reference names in its place, e.g. ``'int'`` as ``int``.
+
+        The reference checker is only kept when its target can't be resolved yet or is
+        being compiled, i.e. when it closes a cycle of a recursive type: only those need
+        check_iteratively().
+        """
+        try:
+            target = checker._resolve()
+        except NameError:
+            return checker
+        if id(target) in self.building:
+            return checker
+        return factory.get_checker(target)
+
+
+class CompiledSignature:
+    """
+    Validation state of a decorated function, resolved once.
+
+    Kept compact so that state built before ``fork()`` is shared by workers and so that
+    decorating many functions stays cheap: neither the ``Signature`` nor the hints dict is
+    retained. Each annotated parameter is a ``(name, kind, index, default, expected_type,
+    checker)`` tuple, enough to pick its value out of ``args``/``kwargs`` without
+    ``Signature.bind``. For ``**kwargs`` the ``default`` slot holds the names that bind to
+    other parameters instead.
+    """
+
+    __slots__ = ('params', 'return_type', 'return_checker')
+
+    def __init__(self, params: tuple[tuple, ...], return_type: Type | None,
+                 return_checker: TypeChecker | None):
+        self.params = params
+        self.return_type = return_type
+        self.return_checker = return_checker
+
+
+class LazySignature:
+    """
+    Signature and hints of a decorated function, compiled on first call or on prewarm.
 
-    def register_checker(self, type_key: Type | Any, checker: TypeChecker):
-        self.checkers[type_key] = checker
+    Compiling is serialized by a lock shared by all functions, so that threads making the
+    first call concurrently don't read the hints while another thread clears them. The lock
+    is replaced in forked children, where it may have been left held by another thread.
+    """
 
-    def get_checker(self, expected_type: Type) -> TypeChecker:
-        origin_type = get_origin(expected_type)
+    __slots__ = ('hints', 'sig', 'globalns', 'compiled', '__weakref__')
 
-        if origin_type in self.checkers:
-            return self.checkers[origin_type]
+    _compile_lock = Lock()
 
-        return StandardTypeChecker()
+    def __init__(self, hints: dict[str, Type], sig: Signature, globalns: dict | None = None):
+        self.hints = hints
+        self.sig = sig
+        self.globalns = globalns
+        self.compiled = None
+
+    def compile(self, signature_helper: 'SignatureHelper') -> CompiledSignature:
+        compiled = self.compiled
+        if compiled is None:
+            with self._compile_lock:
+                compiled = self.compiled
+                if compiled is None:
+                    compiled = self.compiled = signature_helper.compile_signature(
+                        self.hints, self.sig, self.globalns)
+                    self.hints = self.sig = self.globalns = None
+        return compiled
+
+
+def _reset_compile_lock():
+    LazySignature._compile_lock = Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_compile_lock)
 
 
 class SignatureInfo(SignatureInfoInterface):
@@ -165,30 +1085,141 @@ class SignatureInfo(SignatureInfoInterface):
         return hints, sig
 
 
-class ArgsTypeChecker(ArgsTypeCheckerInterface):
+class SignatureCompiler:
     def __init__(self, factory: TypeCheckerFactory):
         self.factory = factory
 
-    def check_args_types(self, func, hints: dict[str, Type], sig: Signature, args: tuple,
-                         kwargs: dict):
-        bound_args = sig.bind(*args, **kwargs)
-        bound_args.apply_defaults()
+    def compile(self, hints: dict[str, Type], sig: Signature,
+                globalns: dict | None = None) -> CompiledSignature:
+        get_checker = self.factory.get_checker
+        keyword_names = frozenset(
+            name for name, param in sig.parameters.items()
+            if param.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+        )
+        params = tuple(
+            (name, param.kind, index,
+             keyword_names if param.kind is Parameter.VAR_KEYWORD else param.default,
+             hints[name], get_checker(hints[name], globalns))
+            for index, (name, param) in enumerate(sig.parameters.items()) if hints.get(name)
+        )
+        return_type = hints.get('return')
+        return_checker = get_checker(return_type, globalns) if return_type else None
+        return CompiledSignature(params, return_type, return_checker)
 
-        for param_name, param_value in bound_args.arguments.items():
-            expected_type = hints.get(param_name)
-            if expected_type and not self.factory.get_checker(expected_type).check_type(
-                    param_value, expected_type):
-                raise ArgumentTypeError(param_name, expected_type, param_value)
+
+class ArgsTypeChecker(ArgsTypeCheckerInterface):
+    """
+    Checks (or coerces) the arguments of a call.
+
+    Mismatches raise ArgumentTypeError, or are passed to ``report(param_name,
+    expected_type, value)`` when given, in which case the call goes on.
+    """
+
+    def check_args_types(self, compiled: CompiledSignature, args: tuple, kwargs: dict,
+                         report: Callable | None = None):
+        for param_name, kind, index, default, expected_type, checker in compiled.params:
+            param_value = bind_argument(param_name, kind, index, default, args, kwargs)
+            if param_value is Parameter.empty:
+                # Missing argument: left for the call itself to report.
+                continue
+            if not checker.check_type(param_value):
+                if report is None:
+                    raise ArgumentTypeError(param_name, expected_type, param_value)
+                report(param_name, expected_type, param_value)
+
+    def coerce_args_types(self, compiled: CompiledSignature, args: tuple, kwargs: dict,
+                          report: Callable | None = None) -> tuple[tuple, dict]:
+        new_args = new_kwargs = None
+
+        for param_name, kind, index, default, expected_type, checker in compiled.params:
+            param_value = bind_argument(param_name, kind, index, default, args, kwargs)
+            if param_value is Parameter.empty:
+                continue
+            try:
+                coerced = checker.coerce(param_value)
+            except (TypeError, ValueError) as err:
+                if report is None:
+                    raise ArgumentTypeError(param_name, expected_type, param_value) from err
+                report(param_name, expected_type, param_value)
+                continue
+            if coerced is param_value:
+                continue
+
+            # Copy args/kwargs only once something actually had to be converted.
+            if kind is Parameter.VAR_POSITIONAL or (
+                    index < len(args) and kind is not Parameter.KEYWORD_ONLY):
+                if new_args is None:
+                    new_args = list(args)
+                if kind is Parameter.VAR_POSITIONAL:
+                    new_args[index:] = coerced
+                else:
+                    new_args[index] = coerced
+            elif kind is Parameter.VAR_KEYWORD:
+                source = kwargs if new_kwargs is None else new_kwargs
+                new_kwargs = {key: v for key, v in source.items() if key in default}
+                new_kwargs.update(coerced)
+            elif kind is not Parameter.POSITIONAL_ONLY:
+                # Defaults of positional-only parameters can't be passed by keyword and
+                # are left as is.
+                if new_kwargs is None:
+                    new_kwargs = dict(kwargs)
+                new_kwargs[param_name] = coerced
+
+        return (args if new_args is None else tuple(new_args),
+                kwargs if new_kwargs is None else new_kwargs)
+
+
+def bind_argument(name: str, kind, index: int, default: Any, args: tuple, kwargs: dict) -> Any:
+    """Pick the value bound to a parameter, as ``Signature.bind`` + ``apply_defaults`` would."""
+    if kind is Parameter.POSITIONAL_OR_KEYWORD:
+        return args[index] if index < len(args) else kwargs.get(name, default)
+    if kind is Parameter.KEYWORD_ONLY:
+        return kwargs.get(name, default)
+    if kind is Parameter.POSITIONAL_ONLY:
+        return args[index] if index < len(args) else default
+    if kind is Parameter.VAR_POSITIONAL:
+        return args[index:]
+    return {key: value for key, value in kwargs.items() if key not in default}
 
 
 class ReturnTypeChecker(ReturnTypeCheckerInterface):
-    def __init__(self, factory: TypeCheckerFactory):
-        self.factory = factory
+    def check_return_type(self, result: Any, compiled: CompiledSignature,
+                          report: Callable | None = None):
+        checker = compiled.return_checker
+        if checker is not None and not checker.check_type(result):
+            if report is None:
+                raise ReturnTypeError(compiled.return_type, type(result))
+            report('return', compiled.return_type, result)
+
+    def coerce_return_type(self, result: Any, compiled: CompiledSignature,
+                           report: Callable | None = None) -> Any:
+        checker = compiled.return_checker
+        if checker is None:
+            return result
+        try:
+            return checker.coerce(result)
+        except (TypeError, ValueError) as err:
+            if report is None:
+                raise ReturnTypeError(compiled.return_type, type(result)) from err
+            report('return', compiled.return_type, result)
+            return result
 
-    def check_return_type(self, result: Any, return_type: Type):
-        if return_type and not self.factory.get_checker(return_type).check_type(result,
-                                                                                return_type):
-            raise ReturnTypeError(return_type, type(result))
+    def check_return_type_lazily(self, result: Any, compiled: CompiledSignature,
+                                 report: Callable | None = None) -> Any:
+        """
+        Return a view checking the items of a returned list/dict on access.
+
+        Return values that can't be viewed (other annotations, or a value of the wrong
+        container type) are checked eagerly and returned as is.
+        """
+        checker = compiled.return_checker
+        if checker is None:
+            return result
+        view = checker.make_view(result, compiled.return_type, report)
+        if view is None:
+            self.check_return_type(result, compiled, report)
+            return result
+        return view
 
 
 class SignatureExtractor:
@@ -206,30 +1237,62 @@ class TypeValidator:
         self.arg_checker = arg_checker
         self.return_checker = return_checker
 
-    def validate_args(self, func, hints: dict[str, Type], sig: Signature, args: tuple,
-                      kwargs: dict):
-        self.arg_checker.check_args_types(func, hints, sig, args, kwargs)
+    def validate_args(self, compiled: CompiledSignature, args: tuple, kwargs: dict,
+                      report: Callable | None = None):
+        self.arg_checker.check_args_types(compiled, args, kwargs, report)
+
+    def validate_return(self, result: Any, compiled: CompiledSignature,
+                        report: Callable | None = None):
+        self.return_checker.check_return_type(result, compiled, report)
 
-    def validate_return(self, result: Any, return_type: Type):
-        self.return_checker.check_return_type(result, return_type)
+    def coerce_args(self, compiled: CompiledSignature, args: tuple, kwargs: dict,
+                    report: Callable | None = None) -> tuple[tuple, dict]:
+        return self.arg_checker.coerce_args_types(compiled, args, kwargs, report)
 
+    def coerce_return(self, result: Any, compiled: CompiledSignature,
+                      report: Callable | None = None) -> Any:
+        return self.return_checker.coerce_return_type(result, compiled, report)
 
-class SignatureHelper:
+    def validate_return_lazily(self, result: Any, compiled: CompiledSignature,
+                               report: Callable | None = None) -> Any:
+        return self.return_checker.check_return_type_lazily(result, compiled, report)
+
+
+class SignatureHelper(SignatureHelperFactory):
     def __init__(self,
                  signature_extractor: SignatureExtractor,
+                 signature_compiler: SignatureCompiler,
                  type_validator: TypeValidator):
         self.signature_extractor = signature_extractor
+        self.signature_compiler = signature_compiler
         self.type_validator = type_validator
 
     def get_signature_and_hints(self, func) -> tuple[dict, Signature]:
         return self.signature_extractor.extract(func)
 
-    def check_args_types(self, func, hints: dict[str, Type], sig: Signature, args: tuple,
-                         kwargs: dict):
-        self.type_validator.validate_args(func, hints, sig, args, kwargs)
+    def compile_signature(self, hints: dict[str, Type], sig: Signature,
+                          globalns: dict | None = None) -> CompiledSignature:
+        return self.signature_compiler.compile(hints, sig, globalns)
+
+    def check_args_types(self, compiled: CompiledSignature, args: tuple, kwargs: dict,
+                         report: Callable | None = None):
+        self.type_validator.validate_args(compiled, args, kwargs, report)
+
+    def check_return_type(self, result: Any, compiled: CompiledSignature,
+                          report: Callable | None = None):
+        self.type_validator.validate_return(result, compiled, report)
+
+    def coerce_args_types(self, compiled: CompiledSignature, args: tuple, kwargs: dict,
+                          report: Callable | None = None) -> tuple[tuple, dict]:
+        return self.type_validator.coerce_args(compiled, args, kwargs, report)
+
+    def coerce_return_type(self, result: Any, compiled: CompiledSignature,
+                           report: Callable | None = None) -> Any:
+        return self.type_validator.coerce_return(result, compiled, report)
 
-    def check_return_type(self, result: Any, return_type: Type):
-        self.type_validator.validate_return(result, return_type)
+    def check_return_type_lazily(self, result: Any, compiled: CompiledSignature,
+                                 report: Callable | None = None) -> Any:
+        return self.type_validator.validate_return_lazily(result, compiled, report)
 
 
 class SignatureCacheManager:
@@ -239,61 +1302,277 @@ class SignatureCacheManager:
         )
 
 
+class EnforcedFunction:
+    """
+    A function decorated by TypeEnforcer.
+
+    Pickles by reference when reachable under its qualified name, like a plain function.
+    Otherwise (e.g. ``checked = type_enforcer()(func)``) it pickles as the undecorated
+    function plus the decorator options: the receiving process rebuilds the wrapper once
+    and compiles its checkers lazily, instead of being sent compiled state.
+    """
+
+    __slots__ = ('lazy_signature', 'signature_helper', 'options', '__dict__', '__weakref__')
+
+    def __init__(self, func, lazy_signature: LazySignature, signature_helper: SignatureHelper,
+                 options: tuple[bool, str, bool]):
+        update_wrapper(self, func)
+        self.lazy_signature = lazy_signature
+        self.signature_helper = signature_helper
+        self.options = options
+
+    def __call__(self, *args, **kwargs):
+        lazy_signature = self.lazy_signature
+        signature_helper = self.signature_helper
+        compiled = lazy_signature.compiled or lazy_signature.compile(signature_helper)
+        signature_helper.check_args_types(compiled, args, kwargs)
+        result = self.__wrapped__(*args, **kwargs)
+        signature_helper.check_return_type(result, compiled)
+        return result
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
+    def __repr__(self) -> str:
+        return f'<enforced function {self.__qualname__}>'
+
+    def __reduce__(self):
+        if self._is_reachable():
+            return self.__qualname__
+        return rebuild_enforced_function, (self.__wrapped__,) + self.options
+
+    def _is_reachable(self) -> bool:
+        obj = sys.modules.get(self.__module__)
+        for name in self.__qualname__.split('.'):
+            obj = getattr(obj, name, None)
+        return obj is self
+
+
+class CoercingFunction(EnforcedFunction):
+    __slots__ = ()
+
+    def __call__(self, *args, **kwargs):
+        lazy_signature = self.lazy_signature
+        signature_helper = self.signature_helper
+        compiled = lazy_signature.compiled or lazy_signature.compile(signature_helper)
+        args, kwargs = signature_helper.coerce_args_types(compiled, args, kwargs)
+        result = self.__wrapped__(*args, **kwargs)
+        return signature_helper.coerce_return_type(result, compiled)
+
+
+class LazyReturnFunction(EnforcedFunction):
+    __slots__ = ()
+
+    def __call__(self, *args, **kwargs):
+        lazy_signature = self.lazy_signature
+        signature_helper = self.signature_helper
+        compiled = lazy_signature.compiled or lazy_signature.compile(signature_helper)
+        signature_helper.check_args_types(compiled, args, kwargs)
+        result = self.__wrapped__(*args, **kwargs)
+        return signature_helper.check_return_type_lazily(result, compiled)
+
+
+class ReportingFunction(EnforcedFunction):
+    """Decorated function that reports violations to a ViolationReporter instead of raising."""
+
+    __slots__ = ('reporter',)
+
+    def __init__(self, func, lazy_signature: LazySignature, signature_helper: SignatureHelper,
+                 options: tuple[bool, str, bool], reporter: ViolationReporter):
+        super().__init__(func, lazy_signature, signature_helper, options)
+        self.reporter = reporter
+
+    def report(self, param_name: str, expected_type: Type, value: Any):
+        self.reporter.record(self.__wrapped__, param_name, expected_type, value, self.options[1])
+
+    def __call__(self, *args, **kwargs):
+        lazy_signature = self.lazy_signature
+        signature_helper = self.signature_helper
+        compiled = lazy_signature.compiled or lazy_signature.compile(signature_helper)
+        report = self.report
+        if self.options[0]:
+            args, kwargs = signature_helper.coerce_args_types(compiled, args, kwargs, report)
+            result = self.__wrapped__(*args, **kwargs)
+            return signature_helper.coerce_return_type(result, compiled, report)
+        signature_helper.check_args_types(compiled, args, kwargs, report)
+        result = self.__wrapped__(*args, **kwargs)
+        if self.options[2]:
+            return signature_helper.check_return_type_lazily(result, compiled, report)
+        signature_helper.check_return_type(result, compiled, report)
+        return result
+
+
 class TypeEnforcer:
     _instance = None
 
-    def __new__(cls, maxsize: int = 64, enable: bool = True):
+    def __new__(cls, maxsize: int = 64, enable: bool = True, on_violation: str = 'raise'):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._init(maxsize, enable)
+            cls._instance._init(maxsize, enable, on_violation)
         return cls._instance
 
     def __del__(self):
         TypeEnforcer._instance = None
 
-    def _init(self, maxsize: int, enable: bool):
+    def _init(self, maxsize: int, enable: bool, on_violation: str):
         self.default_cache_maxsize = maxsize
         self.default_enable = enable
+        self.default_on_violation = on_violation
 
         factory = DefaultTypeCheckerFactory()
         signature_info = SignatureInfo()
-        arg_checker = ArgsTypeChecker(factory)
-        return_checker = ReturnTypeChecker(factory)
+        arg_checker = ArgsTypeChecker()
+        return_checker = ReturnTypeChecker()
 
         signature_extractor = SignatureExtractor(signature_info)
+        signature_compiler = SignatureCompiler(factory)
         type_validator = TypeValidator(arg_checker, return_checker)
 
-        signature_helper = SignatureHelper(signature_extractor, type_validator)
-        self.signature_cache = SignatureCacheManager(signature_helper, maxsize)
+        signature_helper = SignatureHelper(signature_extractor, signature_compiler,
+                                           type_validator)
+        self.signature_caches = {maxsize: SignatureCacheManager(signature_helper, maxsize)}
         self.signature_helper = signature_helper
+        self.factory = factory
+        self.registry = WeakSet()
+        self.violations = ViolationReporter()
+        self.rebuilt = {}
 
-    def __call__(self, func=None, *, maxsize=None, enable=None):
+    def __call__(self, func=None, *, maxsize=None, enable=None, coerce=False, on_violation=None,
+                 lazy_return=False):
         if func is None:
 
             def wrapper(f):
-                return self._decorate(f, maxsize, enable)
+                return self._decorate(f, maxsize, enable, coerce, on_violation, lazy_return)
 
             return wrapper
         else:
-            return self._decorate(func, maxsize, enable)
+            return self._decorate(func, maxsize, enable, coerce, on_violation, lazy_return)
 
-    def _decorate(self, func, maxsize, enable):
+    def _decorate(self, func, maxsize, enable, coerce=False, on_violation=None,
+                  lazy_return=False):
         final_cache_maxsize = maxsize if maxsize is not None else self.default_cache_maxsize
         final_enable = enable if enable is not None else self.default_enable
+        final_on_violation = (on_violation if on_violation is not None
+                              else self.default_on_violation)
+
+        if final_on_violation not in VIOLATION_POLICIES:
+            raise ValueError(f'on_violation must be one of {VIOLATION_POLICIES}, '
+                             f'got {final_on_violation!r}')
+        if coerce and lazy_return:
+            raise ValueError('coerce and lazy_return cannot be combined: coercion has to '
+                             'convert the whole return value')
 
         if not final_enable:
             return func
 
-        signature_cache = SignatureCacheManager(self.signature_helper, final_cache_maxsize)
+        signature_cache = self._get_signature_cache(final_cache_maxsize)
 
         hints, sig = signature_cache.get_cached_signature_and_hints(func)
-        return_type = hints.get('return')
-
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            self.signature_helper.check_args_types(func, hints, sig, args, kwargs)
-            result = func(*args, **kwargs)
-            self.signature_helper.check_return_type(result, return_type)
-            return result
-
-        return wrapper
+        lazy_signature = LazySignature(hints, sig, getattr(unwrap(func), '__globals__', None))
+        self.registry.add(lazy_signature)
+        options = (bool(coerce), final_on_violation, bool(lazy_return))
+
+        if final_on_violation != 'raise':
+            return ReportingFunction(func, lazy_signature, self.signature_helper, options,
+                                     self.violations)
+        if coerce:
+            return CoercingFunction(func, lazy_signature, self.signature_helper, options)
+        if lazy_return:
+            return LazyReturnFunction(func, lazy_signature, self.signature_helper, options)
+        return EnforcedFunction(func, lazy_signature, self.signature_helper, options)
+
+    def rebuild(self, func, coerce: bool, on_violation: str,
+                lazy_return: bool = False) -> EnforcedFunction:
+        """Decorate an unpickled function, reusing the wrapper if it was already rebuilt."""
+        key = (func, coerce, on_violation, lazy_return)
+        enforced = self.rebuilt.get(key)
+        if enforced is None:
+            enforced = self.rebuilt[key] = self._decorate(func, None, True, coerce,
+                                                          on_violation, lazy_return)
+        return enforced
+
+    def is_instance(self, value: Any, annotation: Type, globalns: dict | None = None) -> bool:
+        """
+        Check a value against an annotation, e.g. ``dict[str, list[int | None]]``.
+
+        The annotation is compiled once and the checker is cached and shared with the
+        decorated functions, so checking a stream of values only runs the checker.
+        String forward references (``list['JSON']``) are resolved in ``globalns``.
+        """
+        return self.factory.get_checker(annotation, globalns).check_type(value)
+
+    def validate(self, value: Any, annotation: Type, *, coerce: bool = False,
+                 globalns: dict | None = None) -> Any:
+        """
+        Validate a value against an annotation and return it.
+
+        Args:
+            value: Value to validate.
+            annotation: Expected type.
+            coerce (bool, default=False): Convert compatible values instead of rejecting
+                them, as with ``@type_enforcer(coerce=True)``.
+            globalns (dict, optional): Namespace string forward references are resolved in,
+                usually ``globals()`` of the module defining the annotation.
+
+        Raises:
+            ValidationError: If the value doesn't match (or can't be converted to) the
+                annotation.
+        """
+        checker = self.factory.get_checker(annotation, globalns)
+        if coerce:
+            try:
+                return checker.coerce(value)
+            except (TypeError, ValueError) as err:
+                raise ValidationError(annotation, value) from err
+        if not checker.check_type(value):
+            raise ValidationError(annotation, value)
+        return value
+
+    def _get_signature_cache(self, maxsize: int) -> SignatureCacheManager:
+        signature_cache = self.signature_caches.get(maxsize)
+        if signature_cache is None:
+            signature_cache = self.signature_caches[maxsize] = SignatureCacheManager(
+                self.signature_helper, maxsize)
+        return signature_cache
+
+    def prewarm(self) -> int:
+        """
+        Compile the checkers of every decorated function ahead of the first call.
+
+        Meant to be called in the master process of a preforking server (gunicorn, uWSGI)
+        right before workers are forked, so that workers share the compiled state instead
+        of each building it on their first request. Parts of the checkers that are
+        otherwise compiled on first use (TypedDict and dataclass fields, forward references
+        and type aliases), including those of the checkers cached by
+        ``is_instance()``/``validate()``, are compiled as well.
+
+        Functions (or parts of checkers) whose annotations fail to compile are skipped and
+        left to compile on first call, where the error is raised, so that one broken
+        annotation doesn't stop warming up the others.
+
+        Returns:
+            int: Number of decorated functions that were compiled.
+        """
+        compiled = 0
+        checkers = []
+        for lazy_signature in list(self.registry):
+            was_compiled = lazy_signature.compiled is not None
+            try:
+                signature = lazy_signature.compile(self.signature_helper)
+            except Exception:
+                continue
+            compiled += not was_compiled
+            checkers.extend(param[-1] for param in signature.params)
+            if signature.return_checker is not None:
+                checkers.append(signature.return_checker)
+        checkers.extend(self.factory.compiled.values())
+        checkers.extend(self.factory.scoped.values())
+        resolve_checkers(checkers)
+        return compiled
+
+
+def rebuild_enforced_function(func, coerce: bool, on_violation: str,
+                              lazy_return: bool = False) -> EnforcedFunction:
+    return TypeEnforcer().rebuild(func, coerce, on_violation, lazy_return)
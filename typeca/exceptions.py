@@ -13,3 +13,10 @@ class ReturnTypeError(TypeError):
         self.message = (f"Return value must be of type {return_type}, "
                         f"but got {actual_type.__name__}")
         super().__init__(self.message)
+
+
+class ValidationError(TypeError):
+    def __init__(self, expected_type: Type, value: Any):
+        self.message = (f"Value must be of type {expected_type}, "
+                        f"but got {type(value).__name__}")
+        super().__init__(self.message)
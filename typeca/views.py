@@ -0,0 +1,116 @@
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Type
+
+from .exceptions import ReturnTypeError
+
+
+class CheckedSequence(Sequence):
+    """
+    Read-only view of a returned list or ``tuple[T, ...]`` checking elements on access.
+
+    Indices that passed the check are remembered, so each element is checked at most once
+    however often it is read, and elements that are never read are never checked.
+    """
+
+    __slots__ = ('data', 'checker', 'return_type', 'report', 'validated')
+
+    def __init__(self, data: list | tuple, checker, return_type: Type,
+                 report: Callable | None = None):
+        self.data = data
+        self.checker = checker
+        self.return_type = return_type
+        self.report = report
+        self.validated = bytearray(len(data))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.data)))]
+
+        value = self.data[index]
+        if index < 0:
+            index += len(self.data)
+        validated = self.validated
+        # Items appended to the underlying list after the call aren't tracked.
+        tracked = index < len(validated)
+        if tracked and validated[index]:
+            return value
+        if not self.checker.check_type(value):
+            mismatch(value, self.return_type, self.report)
+        elif tracked:
+            validated[index] = 1
+        return value
+
+    def __iter__(self):
+        for index in range(len(self.data)):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CheckedSequence):
+            other = other.data
+        for _ in self:
+            pass
+        return self.data == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.data!r})'
+
+
+class CheckedMapping(Mapping):
+    """
+    Read-only view of a returned dict checking keys and values on access.
+
+    Keys whose entry passed the check are remembered, so each entry is checked at most
+    once and entries that are never read are never checked.
+    """
+
+    __slots__ = ('data', 'key_checker', 'value_checker', 'return_type', 'report', 'validated')
+
+    def __init__(self, data: dict, key_checker, value_checker, return_type: Type,
+                 report: Callable | None = None):
+        self.data = data
+        self.key_checker = key_checker
+        self.value_checker = value_checker
+        self.return_type = return_type
+        self.report = report
+        self.validated = set()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, key):
+        value = self.data[key]
+        if key in self.validated:
+            return value
+        if not self.key_checker.check_type(key):
+            mismatch(key, self.return_type, self.report)
+        elif not self.value_checker.check_type(value):
+            mismatch(value, self.return_type, self.report)
+        else:
+            self.validated.add(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        # Mapping's default goes through __getitem__, which would check the value.
+        return key in self.data
+
+    def __iter__(self):
+        validated = self.validated
+        check_key = self.key_checker.check_type
+        for key in self.data:
+            if key not in validated and not check_key(key):
+                mismatch(key, self.return_type, self.report)
+            yield key
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.data!r})'
+
+
+def mismatch(value: Any, return_type: Type, report: Callable | None):
+    if report is None:
+        raise ReturnTypeError(return_type, type(value))
+    report('return', return_type, value)
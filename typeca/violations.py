@@ -0,0 +1,114 @@
+import atexit
+import logging
+import os
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, NamedTuple, Type
+
+logger = logging.getLogger('typeca')
+
+VIOLATION_POLICIES = ('raise', 'warn', 'callback')
+
+
+class Violation(NamedTuple):
+    """Type violations of one function parameter with one actual type, aggregated."""
+
+    function: Callable
+    parameter: str
+    expected_type: Type
+    actual_type: type
+    count: int
+
+    @property
+    def message(self) -> str:
+        target = ('Return value' if self.parameter == 'return'
+                  else f"Argument '{self.parameter}'")
+        return (f"{target} of {self.function.__qualname__} must be of type "
+                f"{self.expected_type}, but got {self.actual_type.__name__} "
+                f"({self.count} times)")
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class ViolationReporter:
+    """
+    Aggregates violations of functions decorated with ``on_violation='warn'/'callback'``.
+
+    Recording a violation only bumps a counter keyed by (function, parameter, actual type);
+    nothing is formatted until the pending violations are flushed, at most once per
+    ``interval`` seconds, on the next violation after it elapsed, on ``flush()`` or at
+    exit. Each key is therefore reported at most once per interval however hot the loop
+    producing it. Counts are approximate under concurrent updates.
+    """
+
+    def __init__(self, interval: float = 60.0, callback: Callable | None = None):
+        self.interval = interval
+        self.callback = callback
+        self.pending = {}
+        self.next_flush = monotonic() + interval
+        self._flush_lock = Lock()
+        atexit.register(self.flush)
+        if hasattr(os, 'register_at_fork'):
+            # A thread of the parent may hold the lock at fork time: it would never be
+            # released in the child.
+            os.register_at_fork(after_in_child=self._reset_lock)
+
+    def _reset_lock(self):
+        self._flush_lock = Lock()
+
+    def configure(self, interval: float | None = None, callback: Callable | None = None):
+        """
+        Set the flush interval and/or the callback of ``on_violation='callback'`` functions.
+
+        The callback receives a list of Violation on each flush.
+        """
+        if interval is not None:
+            self.interval = interval
+            self.next_flush = monotonic() + interval
+        if callback is not None:
+            self.callback = callback
+
+    def record(self, func: Callable, param_name: str, expected_type: Type, value: Any,
+               policy: str):
+        key = (func, param_name, type(value))
+        entry = self.pending.get(key)
+        if entry is None:
+            self.pending[key] = [1, expected_type, policy]
+        else:
+            entry[0] += 1
+        if monotonic() >= self.next_flush:
+            self.flush()
+
+    def snapshot(self) -> list[Violation]:
+        """Violations recorded since the last flush, without resetting them."""
+        return [Violation(func, param_name, expected_type, actual_type, count)
+                for (func, param_name, actual_type), (count, expected_type, _)
+                in list(self.pending.items())]
+
+    def flush(self) -> list[Violation]:
+        """Report and reset the pending violations. Returns the reported violations."""
+        with self._flush_lock:
+            pending, self.pending = self.pending, {}
+            self.next_flush = monotonic() + self.interval
+
+        violations = []
+        callback_violations = []
+        for (func, param_name, actual_type), (count, expected_type, policy) in pending.items():
+            violation = Violation(func, param_name, expected_type, actual_type, count)
+            violations.append(violation)
+            if policy == 'callback' and self.callback is not None:
+                callback_violations.append(violation)
+            else:
+                logger.warning('Type violation: %s', violation)
+
+        if callback_violations:
+            # Flushes may run inside a decorated call: a failing callback must not break it,
+            # and its violations are logged as in 'warn' mode rather than dropped.
+            try:
+                self.callback(callback_violations)
+            except Exception:
+                logger.exception('Type violation callback failed')
+                for violation in callback_violations:
+                    logger.warning('Type violation: %s', violation)
+        return violations